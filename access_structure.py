@@ -1,69 +1,135 @@
-from stabilizer_code import four_one_two, eight_one_three, eight_one_two_three, eight_three_three, seven_one_three, five_one_three
-from pauli_methods import multiply_pauli_list, pauli_multiply
-import matplotlib.pyplot as plt
-import networkx as nx
-from itertools import combinations
-
-# Get all supports and their supported logical operators
-support_info = eight_one_two_three.get_supported_operators(1)  # for first logical qubit
-
-all_qubits = set(range(1, 9))
-
-# Create a graph to represent the access structure
-G = nx.DiGraph()  # Using directed graph for clearer hierarchy
-
-# Add nodes and classify them by information content
-no_info_nodes = []    # 0 operators - no info (red)
-partial_info_nodes = []  # 1 operator - partial info (yellow)
-full_info_nodes = []   # 3 operators - full info (green)
-
-# Add all nodes first
-for subset, ops in support_info.items():
-    node_name = str(subset)
-    G.add_node(node_name, level=len(subset))  # Store size as level
-    
-    if len(ops) == 6:
-        full_info_nodes.append(node_name)
-    elif len(ops) == 4:
-        partial_info_nodes.append(node_name)
-    elif {'X1', 'Z3'}.issubset(ops) or {'Z1', 'Z2'}.issubset(ops) or {'Y1', 'Z2Z3'}.issubset(ops):
-        partial_info_nodes.append(node_name)
-    else:
-        no_info_nodes.append(node_name)
-
-
-# Add edges between adjacent levels
-for size in range(len(all_qubits)):
-    for subset1 in combinations(all_qubits, size):
-        node1 = str(subset1)
-        # Connect to supersets one level up
-        for subset2 in combinations(all_qubits, size + 1):
-            if all(q in subset2 for q in subset1):
-                node2 = str(subset2)
-                G.add_edge(node1, node2)
-
-# Set up the plot with hierarchical layout
-plt.figure(figsize=(20, 20))
-pos = nx.multipartite_layout(G, subset_key="level", align='horizontal')
-
-# Draw nodes with different colors based on information content
-nx.draw_networkx_nodes(G, pos, nodelist=no_info_nodes, node_color='red', node_size=500, alpha=0.6)
-nx.draw_networkx_nodes(G, pos, nodelist=partial_info_nodes, node_color='yellow', node_size=500, alpha=0.6)
-nx.draw_networkx_nodes(G, pos, nodelist=full_info_nodes, node_color='green', node_size=500, alpha=0.6)
-
-# Draw edges and labels
-nx.draw_networkx_edges(G, pos, alpha=0.2, arrows=True)
-nx.draw_networkx_labels(G, pos, font_size=6)
-
-plt.title("Complete Access Structure of the Code\nRed: No Info, Yellow: Partial Info, Green: Full Info")
-plt.axis('off')
-plt.tight_layout()
-plt.savefig('access_structure.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-print("Complete access structure graph has been saved as 'access_structure.png'")
-
-# Print detailed results
-print("\nSupports and their logical operators:")
-for support, operators in sorted(support_info.items()):
-    print(f"qubits {support}: {', '.join(operators)}")
+import numpy as np
+from subset_lattice import iter_subsets, mask_to_subset, popcounts, run_shards, shard_ranges, upset
+
+
+# Yield (subset, operators) records of the access structure lazily, in lattice order
+# (by size, then lexicographically), without holding the whole structure in memory.
+# index None covers every product of the quantum and classical logicals.
+def iter_access_structure(code, index=None):
+    yield from code.iter_supported_operators(index)
+
+
+# Yield the Hasse diagram edges (subset, superset) of the subset lattice on n qubits by adding one
+# qubit to each subset, in O(2^n * n)
+def iter_hasse_edges(n):
+    for subset, mask in iter_subsets(n):
+        for q in range(1, n + 1):
+            if not (mask >> (q - 1)) & 1:
+                yield subset, tuple(sorted(subset + (q,)))
+
+
+# Fill rows [offset, ...) of edges with the Hasse edges (mask, mask | qubit bit) of the subset masks
+# in [start, stop), ordered by mask and then by the added qubit
+def _hasse_edge_shard(edges, n, start, stop, offset):
+    masks = np.arange(start, stop, dtype=np.int64)[:, np.newaxis]
+    bits = (np.int64(1) << np.arange(n, dtype=np.int64))[np.newaxis, :]
+    missing = (masks & bits) == 0
+    count = int(missing.sum())
+    edges[offset:offset + count, 0] = np.broadcast_to(masks, missing.shape)[missing]
+    edges[offset:offset + count, 1] = (masks | bits)[missing]
+
+
+# Get every Hasse diagram edge of the subset lattice as an (n * 2^(n-1), 2) array of
+# (subset mask, superset mask) rows, ordered by subset mask and then by the added qubit.
+# workers / executor shard the mask range across processes writing into shared memory.
+def get_hasse_edges(n, workers=None, executor=None):
+    edges = np.zeros((n << (n - 1) if n else 0, 2), dtype=np.int64)
+    # Row where the edges of each subset mask start
+    offsets = np.concatenate([[0], np.cumsum(n - popcounts(n))])
+    shards = shard_ranges(1 << n, (workers or 1) * 4)
+    phases = [(_hasse_edge_shard, [(n, start, stop, int(offsets[start])) for start, stop in shards])]
+    return run_shards(edges, phases, workers, executor)
+
+
+# Get the maximal subsets (as bitmasks) outside an up-set given as a boolean array over 2^n subsets:
+# the subsets that are not in it but where adding any qubit lands in it
+def maximal_outside(flags, n):
+    masks = np.arange(1 << n)
+    maximal = ~flags
+    for i in range(n):
+        bit = 1 << i
+        maximal &= ((masks & bit) != 0) | flags[masks | bit]
+    return np.flatnonzero(maximal).tolist()
+
+
+# Yield (label, minimal authorized sets, maximal unauthorized sets) for each logical operator of a
+# logical qubit. Authorized sets can implement the operator; the two antichains fully describe the
+# access structure without listing every subset. Operators in the same stabilizer coset share
+# one boundary computation.
+def iter_access_boundary(code, index=None):
+    boundaries = {}
+    for label, operator in code.get_labelled_operators(index):
+        minimal = tuple(code.get_minimal_supports(operator))
+        if minimal not in boundaries:
+            flags = upset(minimal, code.n)
+            boundaries[minimal] = ([mask_to_subset(mask) for mask in minimal],
+                                   [mask_to_subset(mask) for mask in maximal_outside(flags, code.n)])
+        authorized, unauthorized = boundaries[minimal]
+        yield label, list(authorized), list(unauthorized)
+
+
+if __name__ == "__main__":
+    from stabilizer_code import eight_one_two_three
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    # Get all supports and their supported logical operators
+    support_info = dict(iter_access_structure(eight_one_two_three, 1))  # for first logical qubit
+
+    # Create a graph to represent the access structure
+    G = nx.DiGraph()  # Using directed graph for clearer hierarchy
+
+    # Add nodes and classify them by information content
+    no_info_nodes = []    # 0 operators - no info (red)
+    partial_info_nodes = []  # 1 operator - partial info (yellow)
+    full_info_nodes = []   # 3 operators - full info (green)
+
+    # Add all nodes first
+    for subset, ops in support_info.items():
+        node_name = str(subset)
+        G.add_node(node_name, level=len(subset))  # Store size as level
+
+        if len(ops) == 6:
+            full_info_nodes.append(node_name)
+        elif len(ops) == 4:
+            partial_info_nodes.append(node_name)
+        elif {'X1', 'Z3'}.issubset(ops) or {'Z1', 'Z2'}.issubset(ops) or {'Y1', 'Z2Z3'}.issubset(ops):
+            partial_info_nodes.append(node_name)
+        else:
+            no_info_nodes.append(node_name)
+
+    # Add edges between adjacent levels
+    for subset1, subset2 in iter_hasse_edges(eight_one_two_three.n):
+        G.add_edge(str(subset1), str(subset2))
+
+    # Set up the plot with hierarchical layout
+    plt.figure(figsize=(20, 20))
+    pos = nx.multipartite_layout(G, subset_key="level", align='horizontal')
+
+    # Draw nodes with different colors based on information content
+    nx.draw_networkx_nodes(G, pos, nodelist=no_info_nodes, node_color='red', node_size=500, alpha=0.6)
+    nx.draw_networkx_nodes(G, pos, nodelist=partial_info_nodes, node_color='yellow', node_size=500, alpha=0.6)
+    nx.draw_networkx_nodes(G, pos, nodelist=full_info_nodes, node_color='green', node_size=500, alpha=0.6)
+
+    # Draw edges and labels
+    nx.draw_networkx_edges(G, pos, alpha=0.2, arrows=True)
+    nx.draw_networkx_labels(G, pos, font_size=6)
+
+    plt.title("Complete Access Structure of the Code\nRed: No Info, Yellow: Partial Info, Green: Full Info")
+    plt.axis('off')
+    plt.tight_layout()
+    plt.savefig('access_structure.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    print("Complete access structure graph has been saved as 'access_structure.png'")
+
+    # Print detailed results
+    print("\nSupports and their logical operators:")
+    for support, operators in sorted(support_info.items()):
+        print(f"qubits {support}: {', '.join(operators)}")
+
+    # Print the boundary of the access structure
+    print("\nMinimal authorized and maximal unauthorized sets:")
+    for label, authorized, unauthorized in iter_access_boundary(eight_one_two_three, 1):
+        print(f"{label}: minimal authorized {authorized}")
+        print(f"{' ' * len(label)}  maximal unauthorized {unauthorized}")
@@ -0,0 +1,249 @@
+import hashlib
+import json
+import os
+import re
+import uuid
+from contextlib import contextmanager
+from pauli_methods import as_pauli
+from symplectic import pauli_to_vector, reduce_vector, row_reduce
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, so the cache is only safe for one process
+    fcntl = None
+
+
+# numpy is imported by the methods that read and write arrays, so the fingerprints stay cheap to import
+
+# Bump whenever the layout or meaning of a stored analysis changes; older entries are rejected
+CACHE_VERSION = 2
+
+# Names of the files this class writes: entry arrays and their temporaries under a fingerprint
+# directory, and index temporaries at the top. Eviction only ever deletes files matching these.
+_FINGERPRINT_DIRECTORY = re.compile(r'[0-9a-f]{32}')
+_ENTRY_FILE = re.compile(r'\w+(-[0-9a-f]{16})?\.\d+\.npy(\.\d+\.tmp)?')
+_INDEX_TEMPORARY = re.compile(r'index\.json\.\d+\.[0-9a-f]{32}\.tmp')
+
+
+# Canonical form of a code for fingerprinting: the reduced row-echelon stabilizer basis (so any
+# generating set of the same group gives the same form) and the logical and classical operators
+# reduced modulo the stabilizer group
+def canonical_form(code):
+    stabilizer_basis = row_reduce([pauli_to_vector(as_pauli(gen)) for gen in code.stabilizers])
+
+    def reduced(operators):
+        return {str(index): format(reduce_vector(pauli_to_vector(as_pauli(op)), stabilizer_basis)[0], 'x')
+                for index, op in sorted(operators.items())}
+
+    return {
+        'n': code.n,
+        'stabilizers': [format(row, 'x') for _, row, _ in stabilizer_basis],
+        'logical_x': reduced(code.logical_x),
+        'logical_z': reduced(code.logical_z),
+        'classical_z': reduced(code.classical_z),
+    }
+
+
+# Fingerprint of a code: a hex digest of its canonical form
+def code_fingerprint(code):
+    canonical = json.dumps(canonical_form(code), sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+# Fingerprint of the exact generator list, for results that depend on the generator order
+def generators_fingerprint(code):
+    generators = ','.join(format(pauli_to_vector(as_pauli(gen)), 'x') for gen in code.stabilizers)
+    return hashlib.sha256(generators.encode()).hexdigest()[:16]
+
+
+class AnalysisCache:
+    # On-disk cache of code analyses. Each entry is one or more .npy files (loaded memory-mapped)
+    # under <directory>/<code fingerprint>/, tracked by index.json with its size. A hit touches the
+    # entry's files, so their mtime is the last use. Entries from another CACHE_VERSION are rejected,
+    # and the least recently used entries are evicted once the total size goes over max_bytes.
+    # Several processes may share a directory: every change to the index happens under a file lock
+    # and is merged into the index on disk, never written over it.
+
+    def __init__(self, directory, max_bytes=1 << 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        os.makedirs(directory, exist_ok=True)
+        self._index_path = os.path.join(directory, 'index.json')
+        self._lock_path = os.path.join(directory, 'index.lock')
+        with self._locked():
+            self._index = self._load_index()
+            self._save_index()
+
+    # Hold the directory's index lock (a no-op where fcntl is unavailable)
+    @contextmanager
+    def _locked(self):
+        with open(self._lock_path, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read_index(self):
+        try:
+            with open(self._index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    # Current index on disk; call with the lock held
+    def _load_index(self):
+        index = self._read_index()
+        if not index or index.get('version') != CACHE_VERSION:
+            # Missing, unreadable or stale index: drop whatever entries it described
+            for entry in (index or {}).get('entries', {}).values():
+                self._remove_files(entry)
+            index = {'version': CACHE_VERSION, 'entries': {}}
+        return index
+
+    # Write the index atomically through a temporary file private to this process
+    def _save_index(self):
+        temporary = f"{self._index_path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        with open(temporary, 'w') as f:
+            json.dump(self._index, f)
+        os.replace(temporary, self._index_path)
+
+    def _remove_files(self, entry):
+        for path in entry.get('files', []):
+            try:
+                os.remove(os.path.join(self.directory, path))
+            except OSError:
+                pass
+
+    # Last use of an entry: the newest mtime of its files (0 once they are gone)
+    def _last_used(self, entry):
+        times = []
+        for path in entry['files']:
+            try:
+                times.append(os.path.getmtime(os.path.join(self.directory, path)))
+            except OSError:
+                return 0.0
+        return max(times, default=0.0)
+
+    # Name of an entry: fingerprint/kind[-key]
+    def _entry_name(self, fingerprint, kind, key):
+        name = kind if key is None else f"{kind}-{hashlib.sha256(str(key).encode()).hexdigest()[:16]}"
+        return f"{fingerprint}/{name}"
+
+    # Load a stored analysis, or None. A tuple of arrays comes back as a tuple.
+    def get(self, fingerprint, kind, key=None):
+        name = self._entry_name(fingerprint, kind, key)
+        import numpy as np
+        entry = self._index['entries'].get(name)
+        if entry is None:
+            # Another process may have stored it since the index was last read
+            index = self._read_index()
+            if index and index.get('version') == CACHE_VERSION:
+                self._index = index
+                entry = index['entries'].get(name)
+        if entry is None or entry.get('version') != CACHE_VERSION:
+            self.stats['misses'] += 1
+            return None
+        try:
+            arrays = [np.load(os.path.join(self.directory, path), mmap_mode='r') for path in entry['files']]
+            for path in entry['files']:
+                os.utime(os.path.join(self.directory, path))
+        except (OSError, ValueError):
+            with self._locked():
+                self._index = self._load_index()
+                self._remove(name)
+                self._save_index()
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        return tuple(arrays) if entry['tuple'] else arrays[0]
+
+    # Store an analysis given as an array or a tuple of arrays. If another process stored the same
+    # entry first, its copy is kept.
+    def put(self, fingerprint, kind, value, key=None):
+        import numpy as np
+        name = self._entry_name(fingerprint, kind, key)
+        arrays = value if isinstance(value, tuple) else (value,)
+        with self._locked():
+            self._index = self._load_index()
+            if name in self._index['entries']:
+                return
+            os.makedirs(os.path.join(self.directory, fingerprint), exist_ok=True)
+            files, size = [], 0
+            for i, array in enumerate(arrays):
+                path = f"{name}.{i}.npy"
+                # Replace rather than overwrite, so readers keep a consistent memory map
+                temporary = os.path.join(self.directory, f"{path}.{os.getpid()}.tmp")
+                with open(temporary, 'wb') as f:
+                    np.save(f, np.ascontiguousarray(array))
+                os.replace(temporary, os.path.join(self.directory, path))
+                files.append(path)
+                size += os.path.getsize(os.path.join(self.directory, path))
+            self._index['entries'][name] = {
+                'version': CACHE_VERSION, 'files': files, 'size': size, 'tuple': isinstance(value, tuple),
+            }
+            self._evict()
+            self._save_index()
+
+    # Load an analysis, computing and storing it on a miss
+    def fetch(self, fingerprint, kind, key, compute):
+        value = self.get(fingerprint, kind, key)
+        if value is None:
+            value = compute()
+            self.put(fingerprint, kind, value, key)
+        return value
+
+    def _remove(self, name):
+        entry = self._index['entries'].pop(name, None)
+        if entry is not None:
+            self._remove_files(entry)
+
+    # Paths, relative to the directory, of the files on disk named like the ones this class writes;
+    # anything else in the directory (and anything deeper than a fingerprint directory) is left alone
+    def _own_files(self):
+        paths = []
+        for name in os.listdir(self.directory):
+            full = os.path.join(self.directory, name)
+            if _INDEX_TEMPORARY.fullmatch(name) and os.path.isfile(full):
+                paths.append(name)
+            elif _FINGERPRINT_DIRECTORY.fullmatch(name) and os.path.isdir(full):
+                paths += [f"{name}/{file_name}" for file_name in os.listdir(full)
+                          if _ENTRY_FILE.fullmatch(file_name) and os.path.isfile(os.path.join(full, file_name))]
+        return paths
+
+    # Delete files on disk that no entry accounts for (left by crashed or racing writers), then
+    # drop least recently used entries until the cache fits in max_bytes; call with the lock held
+    def _evict(self):
+        entries = self._index['entries']
+        known = {path for entry in entries.values() for path in entry['files']}
+        for path in self._own_files():
+            if path not in known:
+                try:
+                    os.remove(os.path.join(self.directory, path))
+                except OSError:
+                    pass
+
+        total = sum(entry['size'] for entry in entries.values())
+        last_used = {name: self._last_used(entry) for name, entry in entries.items()}
+        for name in sorted(entries, key=last_used.get):
+            if total <= self.max_bytes:
+                break
+            total -= entries[name]['size']
+            self._remove(name)
+            self.stats['evictions'] += 1
+
+    # Total size in bytes of the stored entries
+    def size(self):
+        index = self._read_index()
+        return sum(entry['size'] for entry in (index or self._index)['entries'].values())
+
+    # Remove every entry
+    def clear(self):
+        with self._locked():
+            self._index = self._load_index()
+            for name in list(self._index['entries']):
+                self._remove(name)
+            self._save_index()
@@ -0,0 +1,245 @@
+"""
+Batch analysis driver: run analyses over many stabilizer codes and stream the results as JSON Lines.
+
+Codes come from a JSON or YAML file (YAML needs PyYAML) holding a list of code definitions, or a
+{"codes": [...]} object. Each definition has the StabilizerCode arguments, for example
+
+    {"name": "five", "n": 5, "k": 1, "d": 3,
+     "stabilizers": ["XZZXI", "IXZZX", "XIXZZ", "ZXIXZ"],
+     "logical_x": {"1": "XXXXX"}, "logical_z": {"1": "ZZZZZ"}}
+
+with optional "classical_z" and "k_c", or names a built-in code: {"builtin": "eight_three_three"}
+(a bare string works too). Every code is one job on the process pool, so all its analyses share the
+code's memoized group, cosets and supports; --cache-dir also shares them across jobs and runs.
+
+Usage:
+    python analyze.py codes.json --analyses distance min_weights --workers 8 --output results.jsonl
+    python analyze.py --builtin --analyses group cosets access_structure
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from stabilizer_code import BUILTIN_CODES, MAX_ENUMERATED_GENERATORS, MAX_SUBSET_QUBITS, StabilizerCode
+
+
+def load_codes(path):
+    """Read code definitions from a JSON or YAML file and return them as a list of dicts."""
+    with open(path) as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("Reading YAML code files needs PyYAML (pip install pyyaml)")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('codes', [])
+    return [{'builtin': entry} if isinstance(entry, str) else entry for entry in data]
+
+
+def build_code(spec):
+    """Return (name, StabilizerCode) for a code definition, always a new instance (never the shared
+    get_code one), since a job attaches its own cache and memo to the code."""
+    if 'builtin' in spec:
+        if spec['builtin'] not in BUILTIN_CODES:
+            raise KeyError(f"Unknown code: {spec['builtin']!r}")
+        return spec.get('name', spec['builtin']), StabilizerCode(**BUILTIN_CODES[spec['builtin']])
+
+    def operators(field):
+        return {int(index): op for index, op in (spec.get(field) or {}).items()}
+
+    code = StabilizerCode(
+        n=spec['n'],
+        k=spec.get('k', len(spec['logical_x'])),
+        d=spec.get('d'),
+        stabilizers=list(spec['stabilizers']),
+        logical_x=operators('logical_x'),
+        logical_z=operators('logical_z'),
+        classical_z=operators('classical_z'),
+        k_c=spec.get('k_c', len(spec.get('classical_z') or {})),
+    )
+    return spec.get('name', f"code_{spec['n']}_{len(spec['stabilizers'])}"), code
+
+
+def _check_enumerable(code):
+    if len(code.stabilizers) > MAX_ENUMERATED_GENERATORS:
+        raise ValueError(f"{len(code.stabilizers)} generators are too many to enumerate the group")
+
+
+# The access structure keeps several arrays with one row per qubit subset (2^n rows), which past
+# MAX_SUBSET_QUBITS can get a worker killed for memory
+def _check_subsets(code):
+    if code.n > MAX_SUBSET_QUBITS:
+        raise ValueError(f"{code.n} qubits are too many to walk all 2^{code.n} qubit subsets")
+
+
+def analyze_group(code):
+    """Stabilizer group elements and the generators (1-based) whose product gives each."""
+    _check_enumerable(code)
+    group = code.get_stabilizer_group()
+    return {'size': len(group), 'elements': {str(op): indices for op, indices in group.items()}}
+
+
+def analyze_cosets(code):
+    """Minimum-weight representative of every logical and classical product, up to stabilizers."""
+    labelled_operators = code.get_labelled_operators()
+    representatives, weights = code.min_weight_batch([op for _, op in labelled_operators])
+    return {label: {'operator': str(op), 'representative': str(rep), 'weight': int(weight)}
+            for (label, op), rep, weight in zip(labelled_operators, representatives, weights)}
+
+
+def analyze_min_weights(code):
+    """Minimum weight of each of the 4^k logical Paulis, grouped by weight."""
+    labels, _, weights, distribution = code.logical_weight_table()
+    return {'weights': dict(zip(labels, weights.tolist())), 'distribution': distribution}
+
+
+def analyze_access_structure(code):
+    """Minimal authorized and maximal unauthorized qubit sets of every logical and classical product."""
+    from access_structure import iter_access_boundary
+    _check_enumerable(code)
+    _check_subsets(code)
+    return {label: {'authorized': authorized, 'unauthorized': unauthorized}
+            for label, authorized, unauthorized in iter_access_boundary(code)}
+
+
+def analyze_distance(code):
+    """Code distance from the meet-in-the-middle logical search."""
+    return code.code_distance()
+
+
+def analyze_weight_enumerators(code):
+    """Stabilizer and normalizer weight enumerators, and the weight distribution of each logical class."""
+    stabilizer, normalizer = code.weight_enumerators()
+    return {'stabilizer': stabilizer, 'normalizer': normalizer, 'cosets': code.coset_weight_distributions()}
+
+
+ANALYSES = {
+    'group': analyze_group,
+    'cosets': analyze_cosets,
+    'min_weights': analyze_min_weights,
+    'access_structure': analyze_access_structure,
+    'distance': analyze_distance,
+    'weight_enumerators': analyze_weight_enumerators,
+}
+
+
+def _code_name(spec):
+    return spec.get('name', spec.get('builtin')) if isinstance(spec, dict) else None
+
+
+def _error_records(spec, analyses, error):
+    return [{'code': _code_name(spec), 'analysis': analysis, 'error': error} for analysis in analyses]
+
+
+def run_code(spec, analyses, cache_dir=None):
+    """Run the analyses on one code and return one JSON-ready record per analysis.
+
+    A failing analysis gives an error record instead of a result; it never stops the others.
+    """
+    try:
+        name, code = build_code(spec)
+    except Exception as error:
+        return [{'code': _code_name(spec), 'error': f"Invalid code definition: {error!r}"}]
+
+    try:
+        if cache_dir:
+            from analysis_cache import AnalysisCache
+            code.use_cache(AnalysisCache(cache_dir))
+    except Exception as error:
+        return _error_records(spec, analyses, f"Cannot open the cache: {error!r}")
+
+    records = []
+    for analysis in analyses:
+        record = {'code': name, 'analysis': analysis}
+        start = time.perf_counter()
+        try:
+            record['result'] = ANALYSES[analysis](code)
+        except (ValueError, KeyError, MemoryError) as error:
+            record['error'] = str(error)
+        except Exception as error:
+            record['error'] = repr(error)
+        record['seconds'] = time.perf_counter() - start
+        records.append(record)
+    return records
+
+
+def _iter_isolated(specs, analyses, workers, cache_dir):
+    """Run every code in a process of its own, up to workers at a time, so a worker that dies only
+    fails its own code."""
+    for start in range(0, len(specs), workers):
+        chunk = specs[start:start + workers]
+        pools = [ProcessPoolExecutor(max_workers=1) for _ in chunk]
+        try:
+            futures = {pool.submit(run_code, spec, analyses, cache_dir): spec for pool, spec in zip(pools, chunk)}
+            for future in as_completed(futures):
+                try:
+                    yield from future.result()
+                except BrokenProcessPool:
+                    yield from _error_records(futures[future], analyses, "Worker process died (out of memory?)")
+                except Exception as error:
+                    yield from _error_records(futures[future], analyses, repr(error))
+        finally:
+            for pool in pools:
+                pool.shutdown(cancel_futures=True)
+
+
+def iter_results(specs, analyses, workers=1, cache_dir=None):
+    """Yield result records as codes finish; codes run across workers processes when workers > 1.
+
+    If a worker dies (for example killed for using too much memory) the pool breaks and every code
+    still in it fails; those codes are then rerun in one process each, so only the culprit gives
+    error records and the rest of the run goes on.
+    """
+    if workers <= 1:
+        for spec in specs:
+            yield from run_code(spec, analyses, cache_dir)
+        return
+    broken = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_code, spec, analyses, cache_dir): spec for spec in specs}
+        for future in as_completed(futures):
+            try:
+                yield from future.result()
+            except BrokenProcessPool:
+                broken.append(futures[future])
+            except Exception as error:
+                yield from _error_records(futures[future], analyses, repr(error))
+    yield from _iter_isolated(broken, analyses, workers, cache_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run analyses over many stabilizer codes.")
+    parser.add_argument('codes', nargs='?', help="JSON or YAML file of code definitions")
+    parser.add_argument('--builtin', action='store_true', help="also analyze the built-in example codes")
+    parser.add_argument('--analyses', nargs='+', choices=sorted(ANALYSES), default=['distance'],
+                        help="analyses to run on every code")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes (codes run in parallel)")
+    parser.add_argument('--cache-dir', help="on-disk analysis cache shared by the workers and later runs")
+    parser.add_argument('--output', help="JSON Lines output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    specs = load_codes(args.codes) if args.codes else []
+    if args.builtin:
+        specs += [{'builtin': name} for name in BUILTIN_CODES]
+    if not specs:
+        parser.error("no codes given")
+
+    out = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for record in iter_results(specs, args.analyses, args.workers, args.cache_dir):
+            out.write(json.dumps(record) + '\n')
+            out.flush()
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
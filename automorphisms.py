@@ -0,0 +1,224 @@
+from pauli_methods import Pauli, as_pauli
+from symplectic import gf2_rank, pauli_to_vector, reduce_vector
+
+
+# A qubit permutation is a tuple perm with qubit q (0-based) sent to perm[q]
+
+
+# Apply a qubit permutation to a bitmask (bit q moves to bit perm[q])
+def permute_mask(mask, perm):
+    image = 0
+    for q, target in enumerate(perm):
+        if (mask >> q) & 1:
+            image |= 1 << target
+    return image
+
+
+# Apply a qubit permutation to a Pauli (string or Pauli); strings stay strings
+def permute_pauli(operator, perm):
+    pauli = as_pauli(operator)
+    image = Pauli(pauli.n, permute_mask(pauli.x, perm), permute_mask(pauli.z, perm), pauli.phase)
+    return image if isinstance(operator, Pauli) else image.to_string()
+
+
+# Compose two permutations: apply first, then second
+def compose(first, second):
+    return tuple(second[target] for target in first)
+
+
+# Check that a permutation maps the stabilizer group onto itself (up to signs) and every operator
+# into its own stabilizer coset, so supports and access structures are invariant under it
+def is_automorphism(code, perm, operators=()):
+    basis = code.tableau().stabilizer_basis
+    for operator in list(code.stabilizers):
+        image = pauli_to_vector(as_pauli(permute_pauli(operator, perm)))
+        if reduce_vector(image, basis)[0]:
+            return False
+    for operator in operators:
+        vector = pauli_to_vector(as_pauli(operator))
+        image = pauli_to_vector(as_pauli(permute_pauli(operator, perm)))
+        if reduce_vector(image ^ vector, basis)[0]:
+            return False
+    return True
+
+
+# Low-weight elements of the stabilizer group that still generate it, as a set of (x, z) masks.
+# Any automorphism permutes this set, which is what the search below prunes on.
+def _spanning_elements(code):
+    elements = {}
+    for element, _ in code.iter_stabilizer_group():
+        if element.weight:
+            elements.setdefault(element.weight, set()).add((element.x, element.z))
+    rank = gf2_rank([pauli_to_vector(as_pauli(gen)) for gen in code.stabilizers])
+    chosen = set()
+    for weight in sorted(elements):
+        chosen |= elements[weight]
+        if gf2_rank([x | (z << code.n) for x, z in chosen]) == rank:
+            break
+    return chosen
+
+
+# Order the qubits so that the supports of the elements are completed as early as possible: each
+# next qubit is the one closing the most supports, then sharing the most supports with those placed
+def _search_order(elements, n):
+    supports = [x | z for x, z in elements]
+    order, placed = [], 0
+    while len(order) < n:
+        def score(q):
+            bit = 1 << q
+            closed = sum(1 for support in supports if support & bit and not support & ~(placed | bit))
+            touching = sum(1 for support in supports if support & bit and support & placed)
+            return closed, touching, -q
+        q = max((q for q in range(n) if not (placed >> q) & 1), key=score)
+        order.append(q)
+        placed |= 1 << q
+    return order
+
+
+# Points (qubits) in the orbit of a qubit under the group generated by generators
+def _point_orbit(point, generators):
+    return {mask.bit_length() - 1 for mask in orbit(1 << point, generators)}
+
+
+# Find a generating set of the qubit permutations that are automorphisms of the code fixing the
+# coset of each of operators (see is_automorphism), by backtracking over qubit images. Qubits are
+# only sent to qubits with the same profile of low-weight stabilizers, they are assigned in an order
+# that closes supports early, and a partial permutation is dropped as soon as it maps a low-weight
+# stabilizer outside the set of low-weight stabilizers.
+# The group is never listed (Schreier-Sims style): going from the last qubit of the order to the
+# first, with the qubits before it fixed, one automorphism is searched for per image of the qubit
+# outside the orbit reached by the generators found so far. The result is a strong generating
+# set, with at most one generator per point of each of these orbits.
+# Enumerates the whole stabilizer group, so it suits groups of up to ~10^5 elements.
+def find_automorphisms(code, operators=()):
+    n = code.n
+    elements = _spanning_elements(code)
+
+    # Profile of each qubit: how many low-weight stabilizers of each weight act on it as X, Y, Z
+    profiles = []
+    for q in range(n):
+        profile = {}
+        for x, z in elements:
+            kind = ((x >> q) & 1) + 2 * ((z >> q) & 1)
+            if kind:
+                key = ((x | z).bit_count(), kind)
+                profile[key] = profile.get(key, 0) + 1
+        profiles.append(tuple(sorted(profile.items())))
+
+    # Elements to check once the step-th qubit of the order is assigned (the last of their support)
+    order = _search_order(elements, n)
+    position = {q: step for step, q in enumerate(order)}
+    complete_at = [[] for _ in range(n)]
+    for x, z in elements:
+        support = x | z
+        complete_at[max(position[q] for q in range(n) if (support >> q) & 1)].append((x, z))
+
+    perm = [None] * n
+    used = [False] * n
+
+    # Image of a mask whose support is already assigned
+    def image(mask):
+        result = 0
+        for q in range(n):
+            if (mask >> q) & 1:
+                result |= 1 << perm[q]
+        return result
+
+    # Assign qubit order[step] to target if that keeps the checked elements in the set
+    def assign(step, target):
+        perm[order[step]] = target
+        if all((image(x), image(z)) in elements for x, z in complete_at[step]):
+            used[target] = True
+            return True
+        perm[order[step]] = None
+        return False
+
+    def unassign(step):
+        used[perm[order[step]]] = False
+        perm[order[step]] = None
+
+    # First automorphism extending the partial permutation from step on, or None
+    def complete(step):
+        if step == n:
+            candidate = tuple(perm)
+            return candidate if is_automorphism(code, candidate, operators) else None
+        q = order[step]
+        for target in range(n):
+            if used[target] or profiles[target] != profiles[q] or not assign(step, target):
+                continue
+            found = complete(step + 1)
+            unassign(step)
+            if found is not None:
+                return found
+        return None
+
+    generators = []
+    for level in reversed(range(n)):
+        # Every generator found so far fixes the qubits before this level
+        for step in range(level):
+            perm[order[step]] = order[step]
+            used[order[step]] = True
+        base = order[level]
+        reached = _point_orbit(base, generators)
+        failed = set()
+        for target in range(n):
+            if target in reached or target in failed or used[target] or profiles[target] != profiles[base]:
+                continue
+            found = None
+            if assign(level, target):
+                found = complete(level + 1)
+                unassign(level)
+            if found is None:
+                # No automorphism sends base to target, so none sends it anywhere in target's orbit
+                failed |= _point_orbit(target, generators)
+            else:
+                generators.append(found)
+                reached = _point_orbit(base, generators)
+        for step in range(level):
+            perm[order[step]] = None
+            used[order[step]] = False
+    return generators
+
+
+# Orbit of a subset bitmask under the group generated by generators, as a sorted list of masks
+def orbit(mask, generators):
+    seen = {mask}
+    frontier = [mask]
+    while frontier:
+        next_frontier = []
+        for member in frontier:
+            for generator in generators:
+                image = permute_mask(member, generator)
+                if image not in seen:
+                    seen.add(image)
+                    next_frontier.append(image)
+        frontier = next_frontier
+    return sorted(seen)
+
+
+# Orbit representative of every subset bitmask of n qubits: an int64 array mapping each mask to the
+# smallest mask in its orbit under the generators. Computed with whole-array passes (min over the
+# generator images until nothing changes), so no subset is visited from Python.
+def subset_orbits(n, generators):
+    import numpy as np
+    masks = np.arange(1 << n, dtype=np.int64)
+    images = []
+    for generator in generators:
+        image = np.zeros(1 << n, dtype=np.int64)
+        for q, target in enumerate(generator):
+            image |= ((masks >> q) & 1) << target
+        images.append(image)
+
+    representatives = masks.copy()
+    changed = True
+    while changed:
+        changed = False
+        for image in images:
+            # A mask and its image share an orbit, so both take the smaller representative
+            merged = np.minimum(representatives, representatives[image])
+            merged[image] = np.minimum(merged[image], merged)
+            merged = merged[merged]
+            if not np.array_equal(merged, representatives):
+                representatives = merged
+                changed = True
+    return representatives
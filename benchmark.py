@@ -0,0 +1,185 @@
+"""
+Benchmarks for the StabilizerCode hot paths.
+
+Times pauli_multiply, get_stabilizer_group, get_logical_operators, get_supported_operators and the
+logical coset / access structure workloads over the built-in codes and generated surface, toric
+and random code families. Each stage reports wall time, peak traced memory and net allocated
+blocks; results are saved as JSON and can be compared against an earlier run.
+
+Usage:
+    python benchmark.py --output bench.json
+    python benchmark.py --output new.json --compare bench.json --threshold 1.25
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from access_structure import get_hasse_edges, iter_access_boundary
+from code_families import random_stabilizer_code, rotated_surface_code, toric_code
+from pauli_methods import Pauli, pauli_multiply
+import stabilizer_code
+
+# Format version of the JSON results
+RESULTS_VERSION = 1
+
+# Largest n for which the 2^n subset-lattice stages are run
+MAX_LATTICE_QUBITS = 16
+
+# Largest number of generators for which the full stabilizer group stages are run
+MAX_GROUP_GENERATORS = 18
+
+
+def builtin_codes():
+    """Return the built-in codes to benchmark as (name, code) pairs."""
+    return [(name, getattr(stabilizer_code, name)) for name in
+            ('five_one_three', 'seven_one_three', 'eight_three_three', 'eight_one_two_three')]
+
+
+def family_codes(sizes=(3, 4)):
+    """Return generated codes of larger n: rotated surface, toric and random stabilizer codes."""
+    codes = []
+    for d in sizes:
+        codes.append((f"surface_d{d}", rotated_surface_code(d)))
+        codes.append((f"toric_L{d}", toric_code(d)))
+        codes.append((f"random_n{d * d}_k1", random_stabilizer_code(d * d, 1, seed=d, compute_distance=False)))
+    return codes
+
+
+def _random_paulis(n, count, seed):
+    rng = random.Random(seed)
+    return [''.join(rng.choice('IXYZ') for _ in range(n)) for _ in range(count)]
+
+
+def code_stages(code, multiplies=2000):
+    """Return the (stage name, callable) workloads for one code, skipping ones too large to run."""
+    strings = _random_paulis(code.n, multiplies + 1, seed=code.n)
+    paulis = [Pauli.from_string(s) for s in strings]
+    first = min(code.logical_x)
+
+    def multiply_strings():
+        for a, b in zip(strings, strings[1:]):
+            pauli_multiply(a, b)
+
+    def multiply_paulis():
+        for a, b in zip(paulis, paulis[1:]):
+            pauli_multiply(a, b)
+
+    stages = [
+        ('pauli_multiply[str]', multiply_strings),
+        ('pauli_multiply[Pauli]', multiply_paulis),
+        ('code_distance', code.code_distance),
+    ]
+    if len(code.stabilizers) <= MAX_GROUP_GENERATORS:
+        stages += [
+            ('logical_coset_analysis', code.logical_weight_table),
+            ('get_stabilizer_group', code.get_stabilizer_group),
+            ('get_logical_operators', lambda: code.get_logical_operators(code.logical_x[first])),
+        ]
+    if code.n <= MAX_LATTICE_QUBITS and len(code.stabilizers) <= MAX_GROUP_GENERATORS:
+        stages += [
+            ('get_supported_operators', lambda: code.get_supported_operators(first)),
+            ('access_structure', lambda: (list(iter_access_boundary(code, first)), get_hasse_edges(code.n))),
+        ]
+    return stages
+
+
+def measure(fn, repeat=3, reset=None):
+    """Time fn (best of repeat runs) and trace one extra run for peak memory and allocations."""
+    seconds = float('inf')
+    for _ in range(repeat):
+        if reset:
+            reset()
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    if reset:
+        reset()
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    allocated = sys.getallocatedblocks() - blocks
+    del result
+    return {'seconds': seconds, 'peak_bytes': peak, 'allocated_blocks': allocated}
+
+
+def run_benchmarks(codes, repeat=3, stages=None, verbose=True):
+    """Run every stage on every code and return the results as a JSON-ready dict."""
+    results = []
+    for name, code in codes:
+        for stage, fn in code_stages(code):
+            if stages and stage.split('[')[0] not in stages:
+                continue
+            record = {'code': name, 'n': code.n, 'stage': stage}
+            record.update(measure(fn, repeat, reset=code.invalidate_cache))
+            results.append(record)
+            if verbose:
+                print(f"{name:<22} {stage:<26} {record['seconds'] * 1e3:10.2f} ms "
+                      f"{record['peak_bytes'] / 1024:10.1f} KiB {record['allocated_blocks']:8d} blocks")
+    return {
+        'version': RESULTS_VERSION,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare_results(old, new, threshold=1.25, min_seconds=1e-2):
+    """Return (code, stage, old seconds, new seconds) for stages that got slower than threshold."""
+    previous = {(r['code'], r['stage']): r for r in old['results']}
+    regressions = []
+    for record in new['results']:
+        before = previous.get((record['code'], record['stage']))
+        if before is None or max(before['seconds'], record['seconds']) < min_seconds:
+            continue
+        if record['seconds'] > before['seconds'] * threshold:
+            regressions.append((record['code'], record['stage'], before['seconds'], record['seconds']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the StabilizerCode hot paths.")
+    parser.add_argument('--output', default='bench_results.json', help="where to save the JSON results")
+    parser.add_argument('--compare', help="earlier JSON results to check for regressions")
+    parser.add_argument('--threshold', type=float, default=1.25, help="slowdown ratio counted as a regression")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per stage (best is kept)")
+    parser.add_argument('--stages', nargs='*', help="only run these stages")
+    parser.add_argument('--sizes', type=int, nargs='*', default=[3, 4], help="distances/sizes of generated codes")
+    parser.add_argument('--builtin-only', action='store_true', help="skip the generated code families")
+    args = parser.parse_args(argv)
+
+    codes = builtin_codes()
+    if not args.builtin_only:
+        codes += family_codes(args.sizes)
+    results = run_benchmarks(codes, args.repeat, args.stages)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        regressions = compare_results(old, results, args.threshold)
+        for code, stage, before, after in regressions:
+            print(f"REGRESSION {code} {stage}: {before * 1e3:.2f} ms -> {after * 1e3:.2f} ms")
+        if regressions:
+            return 1
+        print("No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
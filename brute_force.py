@@ -0,0 +1,24 @@
+import numpy as np
+from pauli_arrays import pack_paulis, popcount, syndrome_array
+
+
+class PauliSpace:
+    # Every Pauli on the n qubits of a code, for brute-force checks in the tests (n up to about 11).
+    # Pauli v of the 4^n has x = v mod 2^n and z = v >> n; each attribute is an array over all of them:
+    # x and z (uint64), weights, syndromes (bit i = anticommutes with generator i, at most 63
+    # generators), commutes (with every generator, i.e. the normalizer) and stabilizer (in the group).
+
+    def __init__(self, code):
+        n = self.n = code.n
+        vectors = np.arange(1 << (2 * n), dtype=np.uint64)
+        self.x, self.z = vectors & np.uint64((1 << n) - 1), vectors >> np.uint64(n)
+        self.weights = popcount(self.x | self.z).astype(np.int64)
+        gen_X, gen_Z = pack_paulis(code.stabilizers, n)
+        self.syndromes = syndrome_array(self.x[:, np.newaxis], self.z[:, np.newaxis], gen_X, gen_Z)
+        self.commutes = self.syndromes == 0
+        group = [element.x | (element.z << n) for element, _ in code.iter_stabilizer_group()]
+        self.stabilizer = np.isin(vectors, np.array(sorted(set(group)), dtype=np.uint64))
+
+    # Weight distribution of the Paulis selected by a boolean mask
+    def weight_counts(self, selected):
+        return np.bincount(self.weights[selected], minlength=self.n + 1).tolist()
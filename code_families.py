@@ -0,0 +1,99 @@
+import random
+from stabilizer_code import StabilizerCode
+
+
+# Build a Pauli string on n qubits with the given label on each qubit in qubits
+def _pauli_on(n, qubits, label):
+    chars = ['I'] * n
+    for q in qubits:
+        chars[q] = label
+    return ''.join(chars)
+
+
+# Rotated surface code with distance d: [[d^2, 1, d]], qubit (row, col) is index row*d + col
+def rotated_surface_code(d):
+    n = d * d
+    stabilizers = []
+    for row in range(-1, d):
+        for col in range(-1, d):
+            qubits = [r * d + c for r in (row, row + 1) for c in (col, col + 1) if 0 <= r < d and 0 <= c < d]
+            label = 'X' if (row + col) % 2 == 0 else 'Z'
+            if len(qubits) == 4:
+                stabilizers.append(_pauli_on(n, qubits, label))
+            # Weight-2 X checks on the top and bottom edges, Z checks on the left and right edges
+            elif len(qubits) == 2 and label == 'X' and row in (-1, d - 1):
+                stabilizers.append(_pauli_on(n, qubits, label))
+            elif len(qubits) == 2 and label == 'Z' and col in (-1, d - 1):
+                stabilizers.append(_pauli_on(n, qubits, label))
+    return StabilizerCode(
+        n=n,
+        k=1,
+        d=d,
+        stabilizers=stabilizers,
+        logical_x={1: _pauli_on(n, range(0, n, d), 'X')},  # left column
+        logical_z={1: _pauli_on(n, range(d), 'Z')},  # top row
+    )
+
+
+# Toric code on an L x L torus: [[2L^2, 2, L]]. Edge (row, col, 0) is horizontal and
+# (row, col, 1) vertical; one vertex and one plaquette check are dropped as dependent.
+def toric_code(L):
+    n = 2 * L * L
+
+    def edge(row, col, direction):
+        return 2 * ((row % L) * L + (col % L)) + direction
+
+    vertices, plaquettes = [], []
+    for row in range(L):
+        for col in range(L):
+            vertex = [edge(row, col, 0), edge(row, col - 1, 0), edge(row, col, 1), edge(row - 1, col, 1)]
+            plaquette = [edge(row, col, 0), edge(row + 1, col, 0), edge(row, col, 1), edge(row, col + 1, 1)]
+            vertices.append(_pauli_on(n, vertex, 'X'))
+            plaquettes.append(_pauli_on(n, plaquette, 'Z'))
+    return StabilizerCode(
+        n=n,
+        k=2,
+        d=L,
+        stabilizers=vertices[:-1] + plaquettes[:-1],
+        logical_x={1: _pauli_on(n, [edge(row, 0, 0) for row in range(L)], 'X'),
+                   2: _pauli_on(n, [edge(0, col, 1) for col in range(L)], 'X')},
+        logical_z={1: _pauli_on(n, [edge(0, col, 0) for col in range(L)], 'Z'),
+                   2: _pauli_on(n, [edge(row, 0, 1) for row in range(L)], 'Z')},
+    )
+
+
+# Random [[n, k]] stabilizer code: start from the trivial code (stabilizers Z_1..Z_{n-k}, logicals on
+# the last k qubits) and scramble it with random H, S and CNOT gates, which keep all commutation
+# relations. The distance is computed with code_distance unless compute_distance is False.
+def random_stabilizer_code(n, k, seed=None, depth=None, compute_distance=True):
+    rng = random.Random(seed)
+    r = n - k
+    # Each operator as [x bits, z bits] lists
+    operators = [[[0] * n, [1 if q == i else 0 for q in range(n)]] for i in range(r)]
+    operators += [[[1 if q == r + i else 0 for q in range(n)], [0] * n] for i in range(k)]
+    operators += [[[0] * n, [1 if q == r + i else 0 for q in range(n)]] for i in range(k)]
+
+    for _ in range(depth if depth is not None else 4 * n * n):
+        gate = rng.choice('HSC')
+        a, b = rng.sample(range(n), 2) if n > 1 else (0, 0)
+        for x, z in operators:
+            if gate == 'H':
+                x[a], z[a] = z[a], x[a]
+            elif gate == 'S':
+                z[a] ^= x[a]
+            elif a != b:  # CNOT a -> b
+                x[b] ^= x[a]
+                z[a] ^= z[b]
+
+    labels = [''.join('IXZY'[xq + 2 * zq] for xq, zq in zip(x, z)) for x, z in operators]
+    code = StabilizerCode(
+        n=n,
+        k=k,
+        d=None,
+        stabilizers=labels[:r],
+        logical_x={i + 1: labels[r + i] for i in range(k)},
+        logical_z={i + 1: labels[r + k + i] for i in range(k)},
+    )
+    if compute_distance:
+        code.d = code.code_distance()
+    return code
@@ -0,0 +1,60 @@
+import numpy as np
+from pauli_arrays import pack_paulis, syndrome_array, unpack_paulis
+
+
+class LookupDecoder:
+    # Minimum-weight lookup-table decoder for a StabilizerCode. The table is a dense array indexed by
+    # the syndrome integer (bit i = stabilizer generator i, as in StabilizerCode.syndrome), so
+    # decoding a batch of shots is a single fancy-indexing pass.
+
+    def __init__(self, code, max_weight=None, table=None):
+        self.code = code
+        self.max_weight = max_weight
+        self.table_X, self.table_Z, self.weights = table if table is not None else code.syndrome_table(max_weight)
+        self.generators_X, self.generators_Z = pack_paulis(code.stabilizers, code.n)
+
+    # Number of syndromes the table covers
+    def coverage(self):
+        return int((self.weights >= 0).sum())
+
+    # Convert syndromes to integers: an int array of syndrome integers is returned as is, and a
+    # (shots, r) array of 0/1 bits (column i = generator i) is packed
+    def syndrome_integers(self, syndromes):
+        syndromes = np.asarray(syndromes)
+        if syndromes.ndim == 2:
+            return (syndromes.astype(np.int64) << np.arange(syndromes.shape[1], dtype=np.int64)).sum(axis=1)
+        return syndromes.astype(np.int64)
+
+    # Syndromes of a batch of packed (X, Z) errors as an int array
+    def syndromes(self, X, Z):
+        return syndrome_array(X, Z, self.generators_X, self.generators_Z)
+
+    # Decode a batch of syndromes into packed (X, Z) corrections, one row per shot
+    def decode(self, syndromes):
+        syndromes = self.syndrome_integers(syndromes)
+        return self.table_X[syndromes], self.table_Z[syndromes]
+
+    # Decode a batch of packed (X, Z) errors; returns the packed residuals error * correction,
+    # which are in the normalizer whenever the syndrome was covered
+    def correct(self, X, Z):
+        correction_X, correction_Z = self.decode(self.syndromes(X, Z))
+        return X ^ correction_X, Z ^ correction_Z
+
+    # Correction for a single syndrome as an unsigned Pauli string
+    def correction(self, syndrome):
+        X, Z = self.decode([syndrome])
+        return unpack_paulis(X, Z, self.code.n)[0].to_string()
+
+    # Save the table, tagged with the code's generator fingerprint, to a .npz file
+    def save(self, path):
+        np.savez(path, table_X=self.table_X, table_Z=self.table_Z, weights=self.weights,
+                 fingerprint=np.array(self.code.generators_fingerprint()))
+
+    # Load a table saved for the same stabilizer generators; raises ValueError for another code
+    @classmethod
+    def load(cls, code, path):
+        with np.load(path) as data:
+            if str(data['fingerprint']) != code.generators_fingerprint():
+                raise ValueError(f"Decoder table in {path} was built for different stabilizer generators")
+            table = (data['table_X'], data['table_Z'], data['weights'])
+        return cls(code, table=table)
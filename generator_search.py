@@ -0,0 +1,111 @@
+import numpy as np
+from itertools import combinations, product
+from pauli_arrays import num_words, pack_bits, pack_paulis, popcount, unpack_paulis
+from pauli_methods import Pauli, as_pauli
+from symplectic import pauli_to_vector, reduce_vector, row_reduce
+
+
+# Yield all Paulis on n qubits with min_weight <= weight <= max_weight as packed (X, Z) uint64
+# blocks of at most about block_size rows, by weight, then support, then 'X' < 'Y' < 'Z' on each qubit
+def iter_candidate_blocks(n, max_weight, min_weight=1, block_size=1 << 14):
+    block_X, block_Z, rows = [], [], 0
+    for weight in range(max(min_weight, 0), max_weight + 1):
+        # (x, z) bits of every choice of X/Y/Z on weight qubits, shape (3^weight, weight, 2)
+        choices = np.array(list(product(((1, 0), (1, 1), (0, 1)), repeat=weight)), dtype=np.uint8)
+        choices = choices.reshape(-1, weight, 2)
+        for support in combinations(range(n), weight):
+            x_bits = np.zeros((len(choices), n), dtype=np.uint8)
+            z_bits = np.zeros((len(choices), n), dtype=np.uint8)
+            x_bits[:, list(support)] = choices[:, :, 0]
+            z_bits[:, list(support)] = choices[:, :, 1]
+            block_X.append(pack_bits(x_bits))
+            block_Z.append(pack_bits(z_bits))
+            rows += len(choices)
+            if rows >= block_size:
+                yield np.concatenate(block_X), np.concatenate(block_Z)
+                block_X, block_Z, rows = [], [], 0
+    if rows:
+        yield np.concatenate(block_X), np.concatenate(block_Z)
+
+
+# Symplectic commutation matrix between two packed sets: entry [i, j] is True when Pauli i of the
+# first set anticommutes with Pauli j of the second. The words are folded with XOR before the
+# popcount (the parity of a sum of popcounts is the parity of the XOR), so the temporaries are
+# two arrays of len(X1) * len(X2) * words elements.
+def anticommutation_matrix(X1, Z1, X2, Z2):
+    products = X1[:, np.newaxis] & Z2[np.newaxis]
+    products ^= Z1[:, np.newaxis] & X2[np.newaxis]
+    return (popcount(np.bitwise_xor.reduce(products, axis=-1)) & 1).astype(bool)
+
+
+# Collect the candidate Paulis (up to max_weight) that commute with every logical operator, as
+# packed (X, Z) arrays. Candidates are streamed in blocks, so only the survivors are held.
+def commuting_candidates(logical_ops, n, max_weight, min_weight=1, block_size=1 << 14):
+    logical_X, logical_Z = pack_paulis(logical_ops, n)
+    kept_X, kept_Z = [], []
+    for X, Z in iter_candidate_blocks(n, max_weight, min_weight, block_size):
+        if len(logical_ops):
+            keep = ~anticommutation_matrix(X, Z, logical_X, logical_Z).any(axis=1)
+            X, Z = X[keep], Z[keep]
+        kept_X.append(X)
+        kept_Z.append(Z)
+    if not kept_X:
+        empty = np.zeros((0, num_words(n)), dtype=np.uint64)
+        return empty, empty.copy()
+    return np.concatenate(kept_X), np.concatenate(kept_Z)
+
+
+# Yield every set of m candidate generators (as tuples of Pauli strings, or Paulis if the logical
+# operators are Paulis) that commute with the logical operators and with each other and are
+# independent over GF(2), both of each other and of the logical operators.
+# Candidates are all Paulis on n qubits of weight min_weight..max_weight. The commutation matrix
+# of the candidates is built in row chunks of at most max_elements packed words.
+def iter_generator_sets(logical_ops, m, n=None, max_weight=None, min_weight=1, block_size=1 << 14,
+                        max_elements=1 << 22):
+    to_pauli = any(isinstance(op, Pauli) for op in logical_ops)
+    if n is None:
+        n = len(logical_ops[0])
+    if max_weight is None:
+        max_weight = n
+
+    X, Z = commuting_candidates(logical_ops, n, max_weight, min_weight, block_size)
+    candidates = unpack_paulis(X, Z, n)
+
+    # Commuting candidates as a bitmask over candidate indices, one chunk of rows at a time
+    commuting = []
+    chunk = max(1, max_elements // max(1, X.size))
+    for start in range(0, len(candidates), chunk):
+        anticommutes = anticommutation_matrix(X[start:start + chunk], Z[start:start + chunk], X, Z)
+        for row in anticommutes:
+            commuting.append(int.from_bytes(np.packbits(~row, bitorder='little').tobytes(), 'little'))
+
+    vectors = [pauli_to_vector(candidate) for candidate in candidates]
+    logical_basis = row_reduce([pauli_to_vector(as_pauli(op)) for op in logical_ops])
+
+    # Extend the chosen set one candidate at a time, in increasing index order, keeping only
+    # candidates that commute with all chosen ones and lie outside their span with the logicals
+    labels = candidates if to_pauli else [candidate.to_string() for candidate in candidates]
+
+    def extend(chosen, allowed, basis):
+        while allowed:
+            i = (allowed & -allowed).bit_length() - 1
+            allowed &= allowed - 1
+            if not reduce_vector(vectors[i], basis)[0]:
+                continue
+            if len(chosen) == m - 1:
+                yield tuple(labels[j] for j in chosen) + (labels[i],)
+            else:
+                yield from extend(chosen + [i], allowed & commuting[i],
+                                  row_reduce([row for _, row, _ in basis] + [vectors[i]]))
+
+    if m <= 0:
+        yield ()
+        return
+
+    yield from extend([], (1 << len(candidates)) - 1, logical_basis)
+
+
+# Get all valid generator sets of size m as a list (see iter_generator_sets)
+def find_generator_sets(logical_ops, m, n=None, max_weight=None, min_weight=1, block_size=1 << 14,
+                        max_elements=1 << 22):
+    return list(iter_generator_sets(logical_ops, m, n, max_weight, min_weight, block_size, max_elements))
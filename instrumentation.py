@@ -0,0 +1,126 @@
+import contextlib
+import marshal
+import os
+import time
+
+
+# Opt-in instrumentation for the hot paths: named counters (multiplies, cache hits, subsets
+# visited, cosets built, ...) and wall-time spans for the phases of an analysis.
+# Off by default; turn it on with the profiling() context manager, or for a whole process by
+# setting HYBRID_CODES_PROFILE=1. Hot loops guard their calls with "if instrumentation.ENABLED:",
+# so the only cost when off is that check.
+ENABLED = os.environ.get('HYBRID_CODES_PROFILE', '') not in ('', '0')
+
+# Counter name -> count
+counters = {}
+
+# Span name -> [calls, total seconds, self seconds, {parent span name: [calls, seconds]}]
+spans = {}
+
+# Spans currently open, innermost last
+_stack = []
+
+
+# Add amount to a counter
+def count(name, amount=1):
+    counters[name] = counters.get(name, 0) + amount
+
+
+class _Span:
+    # Times one entry into a named span and charges it to the enclosing span
+    __slots__ = ('name', 'start', 'children')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.children = 0.0
+        _stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        _stack.pop()
+        parent = _stack[-1] if _stack else None
+        record = spans.setdefault(self.name, [0, 0.0, 0.0, {}])
+        record[0] += 1
+        # A span re-entered inside itself only counts towards the total once
+        if not any(open_span.name == self.name for open_span in _stack):
+            record[1] += elapsed
+        record[2] += elapsed - self.children
+        if parent is not None:
+            parent.children += elapsed
+            caller = record[3].setdefault(parent.name, [0, 0.0])
+            caller[0] += 1
+            caller[1] += elapsed
+        return False
+
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+# Context manager timing a phase under name; a shared no-op when instrumentation is off
+def span(name):
+    return _Span(name) if ENABLED else _NULL_SPAN
+
+
+# Clear all counters and spans
+def reset():
+    counters.clear()
+    spans.clear()
+
+
+# Counters and spans as a plain JSON-ready dict
+def report():
+    return {
+        'counters': dict(sorted(counters.items())),
+        'spans': {
+            name: {
+                'calls': calls,
+                'seconds': total,
+                'self_seconds': own,
+                'callers': {caller: {'calls': c, 'seconds': s} for caller, (c, s) in sorted(callers.items())},
+            }
+            for name, (calls, total, own, callers) in sorted(spans.items())
+        },
+    }
+
+
+# Write report() to a JSON file
+def save_json(path):
+    import json
+    with open(path, 'w') as f:
+        json.dump(report(), f, indent=2)
+
+
+# Write the spans as a cProfile-compatible stats file, loadable with pstats.Stats(path) or viewers
+# such as snakeviz. Each span appears as a function named after it in the file '<span>'.
+def dump_stats(path):
+    def key(name):
+        return ('<span>', 0, name)
+
+    stats = {}
+    for name, (calls, total, own, callers) in spans.items():
+        stats[key(name)] = (calls, calls, own, total,
+                            {key(caller): (c, c, s, s) for caller, (c, s) in callers.items()})
+    with open(path, 'wb') as f:
+        marshal.dump(stats, f)
+
+
+# Turn instrumentation on inside a with block and restore the previous state afterwards.
+# Yields a dict that is filled with report() when the block exits. Counts start from zero
+# unless reset_counts is False.
+@contextlib.contextmanager
+def profiling(reset_counts=True):
+    global ENABLED
+    previous = ENABLED
+    if reset_counts:
+        reset()
+    ENABLED = True
+    results = {}
+    try:
+        yield results
+    finally:
+        ENABLED = previous
+        results.update(report())
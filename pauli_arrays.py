@@ -0,0 +1,156 @@
+import numpy as np
+from pauli_methods import Pauli, as_pauli
+
+
+# Bits per word of the packed arrays
+WORD_BITS = 64
+
+# Popcount of every byte value, used when numpy has no bitwise_count
+_BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+# Number of uint64 words needed to hold n qubits
+def num_words(n):
+    return max(1, (n + WORD_BITS - 1) // WORD_BITS)
+
+
+# Split a Python int bitmask into little-endian uint64 words
+def mask_to_words(mask, words):
+    return [(mask >> (WORD_BITS * w)) & 0xFFFFFFFFFFFFFFFF for w in range(words)]
+
+
+# Join little-endian uint64 words back into a Python int bitmask
+def words_to_mask(row):
+    mask = 0
+    for w, word in enumerate(row):
+        mask |= int(word) << (WORD_BITS * w)
+    return mask
+
+
+# Pack Pauli strings or Paulis on n qubits into (X, Z) uint64 arrays of shape (len(paulis), words)
+def pack_paulis(paulis, n):
+    words = num_words(n)
+    X = np.zeros((len(paulis), words), dtype=np.uint64)
+    Z = np.zeros((len(paulis), words), dtype=np.uint64)
+    for i, pauli in enumerate(paulis):
+        pauli = as_pauli(pauli)
+        X[i] = mask_to_words(pauli.x, words)
+        Z[i] = mask_to_words(pauli.z, words)
+    return X, Z
+
+
+# Pack a (rows, n) array of 0/1 bits (column q = qubit q) into (rows, words) uint64 bitmask words
+def pack_bits(bits):
+    words = num_words(bits.shape[1])
+    padded = np.zeros((len(bits), words * WORD_BITS), dtype=np.uint8)
+    padded[:, :bits.shape[1]] = bits
+    return np.packbits(padded, axis=1, bitorder='little').view('<u8').astype(np.uint64)
+
+
+# Unpack (X, Z) arrays into a list of unsigned Paulis on n qubits
+def unpack_paulis(X, Z, n):
+    return [Pauli(n, words_to_mask(x), words_to_mask(z)) for x, z in zip(X, Z)]
+
+
+# Element-wise popcount of an unsigned integer array
+def popcount(array):
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(array)
+    as_bytes = array[..., np.newaxis].view(np.uint8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+
+# Weight (number of non-identity qubits) of every packed Pauli, summed over the last (word) axis
+def row_weights(X, Z):
+    return popcount(X | Z).sum(axis=-1, dtype=np.int64)
+
+
+# Syndromes of packed Paulis against packed generator rows, as an int64 array of generator-index
+# bitmasks: bit i is set when the Pauli anticommutes with generator i (at most 63 generators)
+def syndrome_array(X, Z, gen_X, gen_Z):
+    syndromes = np.zeros(len(X), dtype=np.int64)
+    for i, (gx, gz) in enumerate(zip(gen_X, gen_Z)):
+        parity = popcount((X & gz) ^ (Z & gx)).sum(axis=-1, dtype=np.int64) & 1
+        syndromes |= parity << i
+    return syndromes
+
+
+# Build the span of generator rows as (X, Z) arrays of shape (2^r, words); row m is the product
+# of the generators whose bits are set in m
+def span_array(X, Z):
+    span_X = np.zeros((1, X.shape[1]), dtype=np.uint64)
+    span_Z = np.zeros((1, Z.shape[1]), dtype=np.uint64)
+    for x, z in zip(X, Z):
+        span_X = np.concatenate([span_X, span_X ^ x])
+        span_Z = np.concatenate([span_Z, span_Z ^ z])
+    return span_X, span_Z
+
+
+# Yield the elements of the coset offset * span(X, Z) (the span itself when offset is None) as
+# (X, Z) array blocks. The span of the first block_bits rows is built once and the remaining rows
+# are walked in Gray-code order, one XOR of the block per step, so at most 2^block_bits elements
+# are live.
+def iter_span_blocks(X, Z, offset=None, block_bits=16):
+    block = min(len(X), block_bits)
+    block_X, block_Z = span_array(X[:block], Z[:block])
+    shift_X = np.zeros(X.shape[1], dtype=np.uint64)
+    shift_Z = np.zeros(Z.shape[1], dtype=np.uint64)
+    if offset is not None:
+        shift_X ^= offset[0]
+        shift_Z ^= offset[1]
+    for step in range(1 << (len(X) - block)):
+        if step:
+            row = block + (step & -step).bit_length() - 1
+            shift_X ^= X[row]
+            shift_Z ^= Z[row]
+        yield block_X ^ shift_X, block_Z ^ shift_Z
+
+
+# Weight distribution of the coset offset * span(X, Z) as an int64 array counts of length n + 1,
+# counts[w] being the number of elements of weight w (see iter_span_blocks)
+def span_weight_counts(X, Z, n, offset=None, block_bits=16):
+    counts = np.zeros(n + 1, dtype=np.int64)
+    for block_X, block_Z in iter_span_blocks(X, Z, offset, block_bits):
+        counts += np.bincount(row_weights(block_X, block_Z), minlength=n + 1)
+    return counts
+
+
+# Distinct supports of the elements of the coset offset * span(X, Z), as a (supports, words)
+# uint64 array of qubit bitmask rows (see iter_span_blocks)
+def span_supports(X, Z, offset=None, block_bits=16):
+    supports = np.zeros((0, X.shape[1]), dtype=np.uint64)
+    for block_X, block_Z in iter_span_blocks(X, Z, offset, block_bits):
+        supports = np.unique(np.concatenate([supports, block_X | block_Z]), axis=0)
+    return supports
+
+
+# Weight distributions of the cosets operator * group for many packed operators at once, as an
+# int64 array of shape (len(X), n + 1). Operators are processed in chunks so that at most
+# max_elements products are live.
+def coset_weight_counts(X, Z, group_X, group_Z, n, max_elements=1 << 22):
+    chunk = max(1, max_elements // len(group_X))
+    counts = np.zeros((len(X), n + 1), dtype=np.int64)
+    for start in range(0, len(X), chunk):
+        stop = min(start + chunk, len(X))
+        weights = row_weights(X[start:stop, np.newaxis] ^ group_X[np.newaxis],
+                              Z[start:stop, np.newaxis] ^ group_Z[np.newaxis])
+        # Offset each operator's weights into its own slice of n + 1 bins
+        weights += np.arange(stop - start)[:, np.newaxis] * (n + 1)
+        counts[start:stop] = np.bincount(weights.ravel(), minlength=(stop - start) * (n + 1)).reshape(-1, n + 1)
+    return counts
+
+
+# For each packed operator, find the element of operator * group with the lowest weight.
+# Returns (rep_X, rep_Z, weights, group_indices) where group_indices are row indices into the
+# group arrays. Operators are processed in chunks so that at most max_elements products are live.
+def min_weight_in_cosets(X, Z, group_X, group_Z, max_elements=1 << 22):
+    chunk = max(1, max_elements // len(group_X))
+    weights = np.empty(len(X), dtype=np.int64)
+    indices = np.empty(len(X), dtype=np.int64)
+    for start in range(0, len(X), chunk):
+        stop = start + chunk
+        coset_weights = row_weights(X[start:stop, np.newaxis] ^ group_X[np.newaxis],
+                                    Z[start:stop, np.newaxis] ^ group_Z[np.newaxis])
+        indices[start:stop] = coset_weights.argmin(axis=1)
+        weights[start:stop] = coset_weights[np.arange(len(coset_weights)), indices[start:stop]]
+    return X ^ group_X[indices], Z ^ group_Z[indices], weights, indices
@@ -1,7 +1,4 @@
-import numpy as np
-from itertools import combinations, product
-import sympy as sp
-from sympy import Matrix, GF
+import instrumentation
 
 
 # Lookup table for single-qubit Pauli operator multiplication
@@ -12,33 +9,144 @@ PAULI_MULT = {
     ('Z', 'I'): 'Z', ('Z', 'X'): 'Y', ('Z', 'Y'): 'X', ('Z', 'Z'): 'I'
 }
 
+# (x bit, z bit) of each single-qubit Pauli label and back
+PAULI_BITS = {'I': (0, 0), 'X': (1, 0), 'Y': (1, 1), 'Z': (0, 1)}
+BITS_PAULI = {bits: label for label, bits in PAULI_BITS.items()}
+
+# Sign prefixes accepted by Pauli.from_string, as powers of i
+PHASE_PREFIXES = {'': 0, '+': 0, '+i': 1, 'i': 1, '-': 2, '-i': 3}
+PHASE_LABELS = {0: '', 1: 'i', 2: '-', 3: '-i'}
+
+
+class Pauli:
+    # An n-qubit Pauli operator i^phase * P_1 ... P_n stored as X/Z bitmasks (qubit i is bit i).
+    # A product is an XOR of the masks, the weight is a popcount and the support is x | z.
+    __slots__ = ('n', 'x', 'z', 'phase')
+
+    def __init__(self, n, x=0, z=0, phase=0):
+        self.n = n
+        self.x = x
+        self.z = z
+        self.phase = phase % 4
+
+    # Build a Pauli from a string such as 'IXYZ' or '-iXZ'
+    @classmethod
+    def from_string(cls, label):
+        body = label.lstrip('+-i')
+        prefix = label[:len(label) - len(body)]
+        if prefix not in PHASE_PREFIXES:
+            raise ValueError(f"Invalid phase prefix in Pauli string: {label!r}")
+        x = z = 0
+        for i, p in enumerate(body):
+            if p not in PAULI_BITS:
+                raise ValueError(f"Invalid Pauli character {p!r} in {label!r}")
+            xi, zi = PAULI_BITS[p]
+            x |= xi << i
+            z |= zi << i
+        return cls(len(body), x, z, PHASE_PREFIXES[prefix])
+
+    # Return the identity on n qubits
+    @classmethod
+    def identity(cls, n):
+        return cls(n)
+
+    # Return the operator as a plain Pauli string, dropping the phase
+    def to_string(self):
+        return ''.join(BITS_PAULI[((self.x >> i) & 1, (self.z >> i) & 1)] for i in range(self.n))
+
+    # Bitmask of the qubits the operator acts on non-trivially
+    @property
+    def support_mask(self):
+        return self.x | self.z
+
+    # Number of non-identity positions
+    @property
+    def weight(self):
+        return (self.x | self.z).bit_count()
+
+    # Return the support as a sorted tuple of 1-based qubit indices
+    def support(self):
+        mask = self.x | self.z
+        return tuple(i + 1 for i in range(self.n) if (mask >> i) & 1)
+
+    # Check whether two Pauli operators commute (even symplectic product)
+    def commutes(self, other):
+        return ((self.x & other.z) ^ (self.z & other.x)).bit_count() % 2 == 0
+
+    # Same operator with the phase dropped
+    def unsigned(self):
+        return Pauli(self.n, self.x, self.z)
+
+    # Product self * other, tracking the phase
+    def __mul__(self, other):
+        if not isinstance(other, Pauli):
+            return NotImplemented
+        if self.n != other.n:
+            raise ValueError("Pauli operators must have the same length")
+        if instrumentation.ENABLED:
+            instrumentation.count('multiplies')
+        x = self.x ^ other.x
+        z = self.z ^ other.z
+        # Write each factor as i^e X^x Z^z (Y = iXZ), then move Z^z1 past X^x2
+        phase = (self.phase + (self.x & self.z).bit_count()
+                 + other.phase + (other.x & other.z).bit_count()
+                 + 2 * (self.z & other.x).bit_count()
+                 - (x & z).bit_count())
+        return Pauli(self.n, x, z, phase)
+
+    def __eq__(self, other):
+        if not isinstance(other, Pauli):
+            return NotImplemented
+        return (self.n, self.x, self.z, self.phase) == (other.n, other.x, other.z, other.phase)
+
+    def __hash__(self):
+        return hash((self.n, self.x, self.z, self.phase))
+
+    def __len__(self):
+        return self.n
+
+    def __str__(self):
+        return PHASE_LABELS[self.phase] + self.to_string()
+
+    def __repr__(self):
+        return f"Pauli('{self}')"
+
+
+# Convert a Pauli string (or Pauli) to a Pauli
+def as_pauli(operator):
+    if isinstance(operator, Pauli):
+        return operator
+    return Pauli.from_string(operator)
+
 
 # Multiply two Pauli operators of the same length (e.g., 'IXYZ' * 'XIZY')
+# Strings give a string without phase, a Pauli on either side gives a Pauli with phase
 def pauli_multiply(P1, P2):
+    if isinstance(P1, Pauli) or isinstance(P2, Pauli):
+        return as_pauli(P1) * as_pauli(P2)
+
     if len(P1) != len(P2):
         raise ValueError("Pauli operators must have the same length")
-    
+    if instrumentation.ENABLED:
+        instrumentation.count('multiplies')
+
     if len(P1) == 1:
         return PAULI_MULT.get((P1, P2), 'I')
-    
+
     # Multiply each position and join the results
-    result = ''
-    for i in range(len(P1)):
-        result += PAULI_MULT.get((P1[i], P2[i]), 'I')
-    return result
+    return ''.join([PAULI_MULT.get(pair, 'I') for pair in zip(P1, P2)])
 
 
 # Multiply a list of Pauli operators in sequence (e.g., ['IXYZ', 'XIZY', 'IIXY'])
 def multiply_pauli_list(paulis):
     if not paulis:
         raise ValueError("List of Pauli operators cannot be empty")
-    
+
     # Start with the first operator
     result = paulis[0]
-    
+
     # Multiply with each subsequent operator
     for i in range(1, len(paulis)):
         result = pauli_multiply(result, paulis[i])
-    
-    return result
 
+    return result
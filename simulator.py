@@ -0,0 +1,218 @@
+import math
+import os
+import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from statistics import NormalDist
+from decoder import LookupDecoder
+from pauli_arrays import pack_bits, pack_paulis, syndrome_array
+
+
+# Draw shots independent depolarizing errors on n qubits (X, Y or Z each with probability p / 3 per
+# qubit) as packed (X, Z) uint64 arrays
+def sample_depolarizing(rng, shots, n, p):
+    errors = rng.random((shots, n)) < p
+    kinds = rng.integers(0, 3, size=(shots, n))  # 0 = X, 1 = Y, 2 = Z
+    return pack_bits(errors & (kinds != 2)), pack_bits(errors & (kinds != 0))
+
+
+# Operators whose anticommutation with a residual error flags an error, as (check rows, categories).
+# Logical qubit i flips when the residual anticommutes with Z_i (X flip) or X_i (Z flip), and
+# classical bit j when it anticommutes with classical_z[j]. Each category is (name, check bitmask).
+def logical_checks(code):
+    rows, categories = [], []
+    for i in sorted(code.logical_x):
+        categories.append((f"logical_{i}", 0b11 << len(rows)))
+        rows += [code.logical_z[i], code.logical_x[i]]
+    for j in sorted(code.classical_z):
+        categories.append((f"classical_{j}", 1 << len(rows)))
+        rows.append(code.classical_z[j])
+    return rows, categories
+
+
+# Put arrays in shared memory for the worker processes. Returns (blocks, descriptors): the parent
+# closes and unlinks the blocks once the run is over, and the (name, shape, dtype) descriptors are
+# what the batch tasks carry instead of the arrays.
+def _share_arrays(arrays):
+    blocks, descriptors = [], []
+    for array in arrays:
+        block = SharedMemory(create=True, size=max(1, array.nbytes))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        blocks.append(block)
+        descriptors.append((block.name, array.shape, array.dtype.str))
+    return blocks, tuple(descriptors)
+
+
+# Shared arrays a worker is attached to, as (descriptors, blocks, arrays) of the latest run
+_attached = [None, [], ()]
+
+
+# Worker side of _share_arrays: map the arrays, attaching once per run rather than once per batch
+def _attach_arrays(descriptors):
+    if _attached[0] != descriptors:
+        _detach_arrays()
+        # Pool workers share the parent's resource tracker, so the parent's unlink is the only
+        # unregister the blocks need
+        blocks = [SharedMemory(name=name) for name, _, _ in descriptors]
+        arrays = tuple(np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+                       for block, (_, shape, dtype) in zip(blocks, descriptors))
+        _attached[:] = [descriptors, blocks, arrays]
+    return _attached[2]
+
+
+# Drop the arrays and close the blocks of the latest run (the views must go before the blocks)
+def _detach_arrays():
+    blocks = _attached[1]
+    _attached[:] = [None, [], ()]
+    for block in blocks:
+        block.close()
+
+
+# Error counts for one batch: returns an int64 array with, per category, the number of shots it
+# flipped, followed by the number of shots with any logical flip, any classical flip, any flip at
+# all and an uncovered syndrome (these always count as failures). table is the decoder's
+# (table_X, table_Z, weights), or their shared-memory descriptors when shared is set.
+def _batch_counts(task):
+    n, p, shots, seed, generators, table, shared, checks, categories = task
+    rng = np.random.default_rng(seed)
+    X, Z = sample_depolarizing(rng, shots, n, p)
+
+    syndromes = syndrome_array(X, Z, *generators)
+    table_X, table_Z, weights = _attach_arrays(table) if shared else table
+    X ^= table_X[syndromes]
+    Z ^= table_Z[syndromes]
+    uncovered = weights[syndromes] < 0
+    flips = syndrome_array(X, Z, *checks) if len(checks[0]) else np.zeros(shots, dtype=np.int64)
+
+    logical_mask = classical_mask = 0
+    counts = []
+    for name, mask in categories:
+        counts.append(int(np.count_nonzero(flips & mask)))
+        if name.startswith('logical'):
+            logical_mask |= mask
+        else:
+            classical_mask |= mask
+    counts += [
+        int(np.count_nonzero(flips & logical_mask)),
+        int(np.count_nonzero(flips & classical_mask)),
+        int(np.count_nonzero((flips != 0) | uncovered)),
+        int(np.count_nonzero(uncovered)),
+    ]
+    return np.array(counts, dtype=np.int64)
+
+
+# Wilson score interval for failures out of shots at the given confidence level
+def wilson_interval(failures, shots, confidence=0.95):
+    if shots == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rate = failures / shots
+    denominator = 1 + z * z / shots
+    center = (rate + z * z / (2 * shots)) / denominator
+    half = z * math.sqrt(rate * (1 - rate) / shots + z * z / (4 * shots * shots)) / denominator
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+# Results of fn over tasks in order, from an executor with at most window tasks in flight, so tasks
+# are only drawn from the iterator as results are consumed. Closing the generator cancels the tasks
+# not started and waits for the running ones.
+def _bounded_map(executor, fn, tasks, window):
+    pending = deque()
+    try:
+        for task in tasks:
+            pending.append(executor.submit(fn, task))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        wait(pending)
+
+
+# Run shots of depolarizing noise with lookup-table decoding in batches of batch_size, yielding
+# (shots done, {name: failures}) running totals after each batch, so memory stays constant and the
+# run can be stopped early. Every batch has its own child of the seed, spawned as the batch is
+# scheduled, so results do not depend on workers. With workers (or an executor) batches run across
+# processes, at most two per worker in flight, and map the decoder table from shared memory
+# instead of receiving a copy with every batch.
+def iter_error_counts(code, p, shots, batch_size=1 << 16, seed=None, decoder=None, workers=None, executor=None):
+    decoder = decoder or LookupDecoder(code)
+    rows, categories = logical_checks(code)
+    names = [name for name, _ in categories] + ['logical', 'classical', 'failure', 'uncovered']
+    generators = (decoder.generators_X, decoder.generators_Z)
+    table = (decoder.table_X, decoder.table_Z, decoder.weights)
+    checks = pack_paulis(rows, code.n)
+
+    parallel = executor is not None or (workers is not None and workers > 1)
+    blocks = []
+    if parallel:
+        blocks, table = _share_arrays(table)
+    starts = range(0, shots, batch_size)
+    sizes = (min(batch_size, shots - start) for start in starts)
+    # spawn(1) hands out the same children, in order, as one spawn over all batches
+    root = np.random.SeedSequence(seed)
+    tasks = ((code.n, p, min(batch_size, shots - start), root.spawn(1)[0], generators, table, parallel, checks,
+              categories) for start in starts)
+
+    pool = None
+    if executor is None and parallel:
+        pool = executor = ProcessPoolExecutor(max_workers=workers)
+    if parallel:
+        results = _bounded_map(executor, _batch_counts, tasks, 2 * (workers or os.cpu_count() or 1))
+    else:
+        results = map(_batch_counts, tasks)
+
+    totals = np.zeros(len(names), dtype=np.int64)
+    done = 0
+    try:
+        for size, counts in zip(sizes, results):
+            totals += counts
+            done += size
+            yield done, dict(zip(names, totals.tolist()))
+    finally:
+        if parallel:
+            results.close()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if blocks and _attached[0] == table:
+            # Batches ran in this process (e.g. on a thread pool)
+            _detach_arrays()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+# Estimate logical and classical-bit error rates of a code under depolarizing noise of strength p.
+# Returns {name: {'failures', 'shots', 'rate', 'interval'}} for each logical qubit (logical_i),
+# each classical bit (classical_j), any logical / classical flip and any failure at all.
+def logical_error_rates(code, p, shots, batch_size=1 << 16, seed=None, decoder=None, workers=None,
+                        executor=None, confidence=0.95):
+    done, counts = 0, {}
+    for done, counts in iter_error_counts(code, p, shots, batch_size, seed, decoder, workers, executor):
+        pass
+    return {
+        name: {
+            'failures': failures,
+            'shots': done,
+            'rate': failures / done if done else 0.0,
+            'interval': wilson_interval(failures, done, confidence),
+        }
+        for name, failures in counts.items()
+    }
+
+
+if __name__ == "__main__":
+    from stabilizer_code import eight_one_two_three, eight_three_three, five_one_three, seven_one_three
+
+    for code in (five_one_three, seven_one_three, eight_three_three, eight_one_two_three):
+        print(code)
+        for p in (0.001, 0.01, 0.05):
+            rates = logical_error_rates(code, p, 1 << 18, seed=1)
+            line = f"  p = {p:<6} failure {rates['failure']['rate']:.2e}"
+            line += " [{:.2e}, {:.2e}]".format(*rates['failure']['interval'])
+            if code.classical_z:
+                line += f"  logical {rates['logical']['rate']:.2e}  classical {rates['classical']['rate']:.2e}"
+            print(line)
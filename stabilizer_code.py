@@ -1,5 +1,57 @@
-from itertools import combinations
-from pauli_methods import pauli_multiply, multiply_pauli_list
+from itertools import combinations, product
+import instrumentation
+from pauli_methods import Pauli, as_pauli, multiply_pauli_list
+from analysis_cache import code_fingerprint, generators_fingerprint
+from automorphisms import find_automorphisms, is_automorphism, orbit
+from symplectic import (CosetChecks, SymplecticTableau, gf2_rank, iter_weight_paulis, macwilliams_transform,
+                        min_weight_in_coset, min_weight_logical, min_weight_vectors, pauli_to_vector, reduce_vector,
+                        vector_to_pauli)
+
+
+# numpy and the array modules (pauli_arrays, subset_lattice) are imported inside the methods that
+# use them, so importing this module, e.g. in short-lived workers, stays cheap
+
+# Largest number of generators for which weight searches enumerate (or store) the whole group
+MAX_ENUMERATED_GENERATORS = 16
+
+# Largest number of generators for which a dense syndrome table (2^r rows) is built
+MAX_TABLE_GENERATORS = 24
+
+# Largest number of qubits for which arrays over all 2^n qubit subsets are built
+MAX_SUBSET_QUBITS = 22
+
+# Memoized results that depend on the logical and classical operators; everything else in the
+# cache depends only on the stabilizer generators
+LOGICAL_RESULTS = {'tableau', 'fingerprint', 'logical_weights', 'coset_weights', 'automorphisms'}
+
+
+# Inclusion-minimal supports of the coset offset * span(gen_X, gen_Z) on n qubits, from a task
+# (gen_X, gen_Z, offset, n) of packed arrays, as a list of qubit bitmasks sorted by (size, mask).
+# The coset is walked in array blocks; a module-level function so worker processes can run it.
+def _coset_minimal_supports(task):
+    import numpy as np
+    from pauli_arrays import iter_span_blocks, span_supports, words_to_mask
+    from subset_lattice import minimal_antichain, minimal_masks
+    gen_X, gen_Z, offset, n = task
+    if n > MAX_SUBSET_QUBITS:
+        return minimal_antichain(words_to_mask(row) for row in span_supports(gen_X, gen_Z, offset))
+    # Flag the supports over all 2^n subsets (one word per row at this size)
+    flags = np.zeros(1 << n, dtype=bool)
+    for block_X, block_Z in iter_span_blocks(gen_X, gen_Z, offset):
+        flags[(block_X | block_Z)[:, 0].astype(np.int64)] = True
+    return minimal_masks(np.flatnonzero(flags), n)
+
+
+# Convert a generator-index bitmask (bit i = generator i) to the sorted list of 1-based indices
+def mask_to_indices(mask):
+    indices = []
+    i = 1
+    while mask:
+        if mask & 1:
+            indices.append(i)
+        mask >>= 1
+        i += 1
+    return indices
 
 
 class StabilizerCode:
@@ -11,50 +63,533 @@ class StabilizerCode:
         self.k = k  # number of logical qubits
         self.k_c = k_c  # number of classical bits (for hybrid codes)
         self.d = d  # code distance
+        self._cache = {}  # memoized group, cosets and supports, cleared by invalidate_cache()
+        self.cache_stats = {'hits': 0, 'misses': 0}
+        self.persistent_cache = None  # optional AnalysisCache shared across runs, see use_cache()
         self.stabilizers = stabilizers
         self.logical_x = logical_x
         self.logical_z = logical_z
         self.classical_z = classical_z if classical_z else {}
+
+    # Assigning any of the operator attributes drops the memoized results.
+    # Mutating them in place (e.g. stabilizers.append) needs an explicit invalidate_cache().
+    @property
+    def stabilizers(self):
+        return self._stabilizers
+
+    @stabilizers.setter
+    def stabilizers(self, value):
+        self._stabilizers = value
+        self.invalidate_cache()
+
+    @property
+    def logical_x(self):
+        return self._logical_x
+
+    @logical_x.setter
+    def logical_x(self, value):
+        self._logical_x = value
+        self.invalidate_cache()
+
+    @property
+    def logical_z(self):
+        return self._logical_z
+
+    @logical_z.setter
+    def logical_z(self, value):
+        self._logical_z = value
+        self.invalidate_cache()
+
+    @property
+    def classical_z(self):
+        return self._classical_z
+
+    @classical_z.setter
+    def classical_z(self, value):
+        self._classical_z = value
+        self.invalidate_cache()
+
+    # Drop every memoized result (the hit/miss counters are kept)
+    def invalidate_cache(self):
+        self._cache.clear()
+
+    # Drop the memoized results that depend on the logical or classical operators
+    def _invalidate_logical_results(self):
+        for key in list(self._cache):
+            if (key[0] if isinstance(key, tuple) else key) in LOGICAL_RESULTS:
+                del self._cache[key]
+
+    # Replace the logical X and/or Z operator of a logical qubit. Results that only depend on the
+    # stabilizer group (group, cosets, supports, distance, syndrome table, ...) are kept.
+    def replace_logical(self, index, logical_x=None, logical_z=None):
+        if logical_x is not None:
+            self._logical_x = {**self._logical_x, index: logical_x}
+        if logical_z is not None:
+            self._logical_z = {**self._logical_z, index: logical_z}
+        self._invalidate_logical_results()
+
+    # Append a stabilizer generator. The memoized group, cosets, supports, minimal supports and group
+    # arrays are extended from the old ones: each old element e contributes e * generator, so the
+    # group doubles by one multiply (or XOR) per element instead of a fresh 2^r walk. Other results
+    # are dropped. A generator already in the group leaves it unchanged, and everything is dropped.
+    def add_stabilizer(self, generator):
+        import numpy as np
+        from pauli_arrays import mask_to_words, num_words, pack_paulis, words_to_mask
+        from subset_lattice import minimal_antichain
+        old_cache = dict(self._cache)
+        pauli = as_pauli(generator)
+        if not reduce_vector(pauli_to_vector(pauli), self._coset_checks().stabilizer_basis)[0]:
+            self.stabilizers = self._stabilizers + [generator]
+            return
+
+        # Minimal supports of o * S' are those of o * S together with (o * generator) * S, all
+        # collected in one walk over the old group
+        minimal_keys = [key for key in old_cache if isinstance(key, tuple) and key[0] == 'minimal_supports']
+        shifted = [vector_to_pauli(key[1], self.n) * pauli for key in minimal_keys]
+        extra_masks = [set() for _ in minimal_keys]
+        if minimal_keys:
+            for element, _ in self.iter_stabilizer_group():
+                for masks, operator in zip(extra_masks, shifted):
+                    masks.add((operator.x ^ element.x) | (operator.z ^ element.z))
+
+        self._stabilizers = self._stabilizers + [generator]
+        self._cache.clear()
+        new_index = len(self._stabilizers)
+        basis = self._coset_checks().stabilizer_basis
+        X, Z = pack_paulis([generator], self.n)
+        for key, value in old_cache.items():
+            kind = key[0] if isinstance(key, tuple) else key
+            if kind in ('group', 'coset'):
+                # Both are dicts of element -> generator indices. The Gray-code walk of the new group
+                # visits the new elements in the reverse of the old order, so they are added that way.
+                extended = dict(value)
+                for element, indices in reversed(list(value.items())):
+                    product = as_pauli(element) * pauli
+                    if not isinstance(element, Pauli):
+                        product = product.to_string()
+                    if product not in extended:
+                        extended[product] = indices + [new_index]
+                self._cache[key] = extended
+            elif kind in ('group_array', 'coset_array'):
+                span_X, span_Z = value
+                self._cache[key] = (np.concatenate([span_X, span_X ^ X]), np.concatenate([span_Z, span_Z ^ Z]))
+
+        # Supports follow from the extended cosets
+        for key in old_cache:
+            if isinstance(key, tuple) and key[0] == 'supports' and ('coset', key[1]) in self._cache:
+                self._cache[key] = self._build_all_supports(key[1])
+
+        words = num_words(self.n)
+        for key, extra in zip(minimal_keys, extra_masks):
+            minimal = minimal_antichain([words_to_mask(row) for row in old_cache[key]] + sorted(extra))
+            self._cache[('minimal_supports', reduce_vector(key[1], basis)[0])] = np.array(
+                [mask_to_words(mask, words) for mask in minimal], dtype=np.uint64).reshape(-1, words)
+
+    # Remove the stabilizer generator with the given 1-based index. The memoized group, cosets,
+    # supports and group arrays are cut down to the elements that do not use it, and later
+    # generator indices shift down by one; other results are dropped. If the generators were not
+    # independent, the recorded indices are not unique and everything is dropped.
+    def remove_stabilizer(self, index):
+        if not 1 <= index <= len(self._stabilizers):
+            raise IndexError(f"Stabilizer index {index} is outside 1..{len(self._stabilizers)}")
+        old_cache = dict(self._cache)
+        rest = self._stabilizers[:index - 1] + self._stabilizers[index:]
+        independent = gf2_rank([pauli_to_vector(as_pauli(gen)) for gen in self._stabilizers]) == len(self._stabilizers)
+        self.stabilizers = rest
+        if not independent:
+            return
+
+        for key, value in old_cache.items():
+            kind = key[0] if isinstance(key, tuple) else key
+            if kind in ('group', 'coset'):
+                self._cache[key] = {element: [i if i < index else i - 1 for i in indices]
+                                    for element, indices in value.items() if index not in indices}
+            elif kind in ('group_array', 'coset_array'):
+                # Row m uses generator index - 1 when bit index - 1 of m is set
+                span_X, span_Z = value
+                half = 1 << (index - 1)
+                self._cache[key] = tuple(span.reshape(-1, 2, half, span.shape[-1])[:, 0].reshape(-1, span.shape[-1])
+                                         for span in (span_X, span_Z))
+        for key in old_cache:
+            if isinstance(key, tuple) and key[0] == 'supports' and ('coset', key[1]) in self._cache:
+                self._cache[key] = self._build_all_supports(key[1])
+
+    # Return the cached value for key, computing and storing it on a miss
+    def _cached(self, key, compute):
+        if key in self._cache:
+            self.cache_stats['hits'] += 1
+            if instrumentation.ENABLED:
+                instrumentation.count('cache_hits')
+            return self._cache[key]
+        self.cache_stats['misses'] += 1
+        if instrumentation.ENABLED:
+            instrumentation.count('cache_misses')
+        value = compute()
+        self._cache[key] = value
+        return value
     
+    # Keep array results (stabilizer group, cosets, minimal supports, weight tables, access
+    # structures, distance) in an on-disk AnalysisCache, so later runs load them instead of
+    # recomputing; pass None to stop using it
+    def use_cache(self, cache):
+        self.persistent_cache = cache
+        self.invalidate_cache()
+
+    # Like _cached, but also backed by the persistent cache when one is attached. kind and key
+    # name the entry under the code fingerprint; compute must return an array or tuple of arrays.
+    # Results that depend on the order of the generators pass by_generators=True.
+    def _persisted(self, kind, key, compute, by_generators=False):
+        def load_or_compute():
+            if self.persistent_cache is None:
+                return compute()
+            persistent_key = (key, self.generators_fingerprint()) if by_generators else key
+            return self.persistent_cache.fetch(self.fingerprint(), kind, persistent_key, compute)
+        return self._cached((kind, key), load_or_compute)
+
+    # Fingerprint of the code's canonical stabilizer group, logicals and classical operators
+    def fingerprint(self):
+        return self._cached('fingerprint', lambda: code_fingerprint(self))
+
+    # Fingerprint of the exact generator list
+    def generators_fingerprint(self):
+        return self._cached('generators_fingerprint', lambda: generators_fingerprint(self))
+
+    # Canonical representative of the stabilizer coset of an operator, as a packed vector
+    def _canonical_coset(self, operator):
+        return reduce_vector(pauli_to_vector(as_pauli(operator)), self._coset_checks().stabilizer_basis)[0]
+
     # Return string representation in [[n,k,d]] or [[n,k:c,d]] format
     def __str__(self):
         if self.k_c > 0:
             return f"[[{self.n},{self.k}:{self.k_c},{self.d}]] Hybrid Code"
         return f"[[{self.n},{self.k},{self.d}]] Stabilizer Code"
     
-    # Calculate all elements of the stabilizer group by multiplying combinations of generators
+    # Return True if results should be Pauli objects rather than strings (any operator given as a Pauli)
+    def _uses_pauli(self, *operators):
+        return any(isinstance(op, Pauli) for op in operators)
+
+    # Walk the stabilizer group in Gray-code order, yielding (element, generator-index-mask) pairs.
+    # Bit i of the mask is set when generator i (0-based) is in the product; consecutive elements
+    # differ by exactly one generator, so each step is a single multiply and nothing is stored.
+    def iter_stabilizer_group(self):
+        generators = [as_pauli(gen) for gen in self.stabilizers]
+        element = Pauli.identity(self.n)
+        mask = 0
+        yield element, mask
+        for step in range(1, 1 << len(generators)):
+            flip = (step & -step).bit_length() - 1
+            element = element * generators[flip]
+            mask ^= 1 << flip
+            yield element, mask
+
+    # Calculate all elements of the stabilizer group as a dict of stabilizer -> generator indices
     def get_stabilizer_group(self):
+        to_pauli = self._uses_pauli(*self.stabilizers)
+        stabilizer_dict = self._cached(('group', to_pauli), lambda: self._build_stabilizer_group(to_pauli))
+        return {stabilizer: list(indices) for stabilizer, indices in stabilizer_dict.items()}
+
+    def _build_stabilizer_group(self, to_pauli):
         # Dictionary to store stabilizer -> list of generator indices
-        stabilizer_dict = {'I' * self.n: []}  # Identity comes from empty product
-        
-        # Add individual generators first
-        for i, gen in enumerate(self.stabilizers):
-            stabilizer_dict[gen] = [i+1]
-        
-        # Try all combinations of generators
-        for r in range(2, len(self.stabilizers) + 1):
-            for combo_indices in combinations(range(len(self.stabilizers)), r):
-                combo = [self.stabilizers[i] for i in combo_indices]
-                product = multiply_pauli_list(combo)
-                stabilizer_dict[product] = list(i+1 for i in combo_indices)
-        
+        stabilizer_dict = {}
+        with instrumentation.span('stabilizer_group'):
+            for stabilizer, mask in self.iter_stabilizer_group():
+                stabilizer_dict[stabilizer if to_pauli else stabilizer.to_string()] = mask_to_indices(mask)
         return stabilizer_dict
 
     # Calculate all the possible logical operators for an operator by multiplying it with all the elements of the stabilizer group
     def get_logical_operators(self, operator):
-        stabilizer_group = self.get_stabilizer_group()
+        logical_operators = self._cached(('coset', operator), lambda: self._build_logical_operators(operator))
+        return {logical_operator: list(indices) for logical_operator, indices in logical_operators.items()}
+
+    def _build_logical_operators(self, operator):
+        to_pauli = self._uses_pauli(operator)
+        operator = as_pauli(operator)
         logical_operators = {}
-        
+        if instrumentation.ENABLED:
+            instrumentation.count('cosets_built')
+
         # Then multiply with each stabilizer and track which ones were used
-        for stabilizer, indices in stabilizer_group.items():
-            product = pauli_multiply(operator, stabilizer)
-            if product not in logical_operators:  # Only add if we haven't seen this operator before
-                logical_operators[product] = indices
-        
+        with instrumentation.span('coset'):
+            for stabilizer, mask in self.iter_stabilizer_group():
+                product = operator * stabilizer
+                if not to_pauli:
+                    product = product.to_string()
+                if product not in logical_operators:  # Only add if we haven't seen this operator before
+                    logical_operators[product] = mask_to_indices(mask)
+
         return logical_operators
 
+    # Symplectic check data for the stabilizer group, shared by the weight searches
+    def _coset_checks(self):
+        return self._cached('coset_checks', lambda: CosetChecks(
+            [pauli_to_vector(as_pauli(gen)) for gen in self.stabilizers], self.n))
+
+    # Reduced row-echelon tableau of the stabilizers, logicals and classical operators
+    def tableau(self):
+        def build():
+            def vectors(operators):
+                return {index: pauli_to_vector(as_pauli(op)) for index, op in operators.items()}
+            return SymplecticTableau([pauli_to_vector(as_pauli(gen)) for gen in self.stabilizers],
+                                     vectors(self.logical_x), vectors(self.logical_z),
+                                     vectors(self.classical_z), self.n)
+        return self._cached('tableau', build)
+
+    # Syndrome of an operator as a generator-index bitmask: bit i is set when it anticommutes
+    # with stabilizer generator i (0-based)
+    def syndrome(self, operator):
+        return self.tableau().syndrome(pauli_to_vector(as_pauli(operator)))
+
+    # Check whether an operator is in the stabilizer group without enumerating it.
+    # A Pauli must also carry the phase of the generator product; strings are compared unsigned.
+    def is_stabilizer(self, operator):
+        combination = self.tableau().stabilizer_combination(pauli_to_vector(as_pauli(operator)))
+        if combination is None:
+            return False
+        if isinstance(operator, Pauli):
+            return self._generator_product(combination).phase == operator.phase
+        return True
+
+    # Get the logical operator an operator implements up to stabilizers, labelled as in
+    # get_labelled_operators(None) (e.g. 'X1', 'Y1Z2Z3'); '' for a stabilizer.
+    # Raises ValueError for operators that do not commute with the stabilizers.
+    def logical_class(self, operator):
+        quantum, classical = self.tableau().logical_class(pauli_to_vector(as_pauli(operator)))
+        return (''.join(label + str(index) for index, label in sorted(quantum.items()))
+                + ''.join('Z' + str(index) for index in classical))
+
+    # Minimum-weight correction for every syndrome, as dense (table_X, table_Z, weights) arrays indexed
+    # by the syndrome integer (see syndrome). Built breadth-first over Paulis of weight 0, 1, 2, ...
+    # until every reachable syndrome is covered or max_weight is passed; the first Pauli found for a
+    # syndrome is kept. Uncovered syndromes have weight -1 and an identity correction.
+    def syndrome_table(self, max_weight=None):
+        return self._persisted('syndrome_table', max_weight, lambda: self._build_syndrome_table(max_weight),
+                               by_generators=True)
+
+    def _build_syndrome_table(self, max_weight):
+        import numpy as np
+        from pauli_arrays import mask_to_words, num_words
+        tableau = self.tableau()
+        r = len(tableau.generators)
+        if r > MAX_TABLE_GENERATORS:
+            raise ValueError(f"A syndrome table for {r} generators would have 2^{r} rows")
+        words = num_words(self.n)
+        table_X = np.zeros((1 << r, words), dtype=np.uint64)
+        table_Z = np.zeros((1 << r, words), dtype=np.uint64)
+        weights = np.full(1 << r, -1, dtype=np.int64)
+        weights[0] = 0
+        reachable = 1 << gf2_rank(tableau.generators)
+        found = 1
+        with instrumentation.span('syndrome_table'):
+            for weight in range(1, (max_weight or self.n) + 1):
+                if found == reachable:
+                    break
+                for syndrome, x, z in iter_weight_paulis(range(self.n), weight, tableau.qubit_options):
+                    if weights[syndrome] < 0:
+                        weights[syndrome] = weight
+                        table_X[syndrome] = mask_to_words(x, words)
+                        table_Z[syndrome] = mask_to_words(z, words)
+                        found += 1
+        return table_X, table_Z, weights
+
+    # Express a packed vector of the stabilizer group as a signed product of the generators
+    def _stabilizer_element(self, vector):
+        remainder, combination = reduce_vector(vector, self._coset_checks().stabilizer_basis)
+        if remainder:
+            raise ValueError("Operator is not in the stabilizer group")
+        return self._generator_product(combination)
+
+    # Signed product of the generators selected by a generator-index mask (bit i = generator i)
+    def _generator_product(self, mask):
+        element = Pauli.identity(self.n)
+        for i, gen in enumerate(self.stabilizers):
+            if (mask >> i) & 1:
+                element = element * as_pauli(gen)
+        return element
+
+    # Get a minimum-weight operator equivalent to operator up to stabilizers.
+    # 'enumerate' walks the group in Gray-code order and returns the first minimum, like min() over
+    # get_logical_operators; 'search' runs a meet-in-the-middle syndrome search over GF(2) and never
+    # builds the group. By default groups with up to MAX_ENUMERATED_GENERATORS generators are enumerated.
+    def min_weight_representative(self, operator, method=None):
+        to_pauli = self._uses_pauli(operator)
+        operator = as_pauli(operator)
+        if method is None:
+            method = 'enumerate' if len(self.stabilizers) <= MAX_ENUMERATED_GENERATORS else 'search'
+
+        if method == 'enumerate':
+            best_weight, best = None, None
+            for stabilizer, _ in self.iter_stabilizer_group():
+                weight = ((operator.x ^ stabilizer.x) | (operator.z ^ stabilizer.z)).bit_count()
+                if best_weight is None or weight < best_weight:
+                    best_weight, best = weight, stabilizer
+            representative = operator * best
+        elif method == 'search':
+            vector = pauli_to_vector(operator)
+            found = min_weight_in_coset(self._coset_checks(), vector)
+            representative = operator * self._stabilizer_element(found ^ vector)
+        else:
+            raise ValueError(f"Unknown method: {method}")
+
+        return representative if to_pauli else representative.to_string()
+
+    # Stabilizer group as packed (X, Z) uint64 arrays; row m is the product of the generators in mask m
+    def get_stabilizer_group_array(self):
+        from pauli_arrays import pack_paulis, span_array
+        def build():
+            with instrumentation.span('stabilizer_group_array'):
+                return span_array(*pack_paulis(self.stabilizers, self.n))
+        return self._persisted('group_array', None, build, by_generators=True)
+
+    # Coset operator * S as packed (X, Z) arrays, in the same order as get_stabilizer_group_array
+    def get_logical_operators_array(self, operator):
+        from pauli_arrays import pack_paulis
+        def build():
+            group_X, group_Z = self.get_stabilizer_group_array()
+            if instrumentation.ENABLED:
+                instrumentation.count('cosets_built')
+            X, Z = pack_paulis([operator], self.n)
+            return group_X ^ X, group_Z ^ Z
+        return self._persisted('coset_array', pauli_to_vector(as_pauli(operator)), build, by_generators=True)
+
+    # Get minimum-weight representatives of a whole batch of operators in one vectorized pass.
+    # operators is a list of strings/Paulis, or a packed (X, Z) pair of uint64 arrays.
+    # Returns (representatives, weights) with representatives in the same form as operators.
+    def min_weight_batch(self, operators, max_elements=1 << 22):
+        with instrumentation.span('min_weight_batch'):
+            return self._min_weight_batch(operators, max_elements)
+
+    def _min_weight_batch(self, operators, max_elements):
+        from pauli_arrays import min_weight_in_cosets, pack_paulis, row_weights, unpack_paulis
+        packed = isinstance(operators, tuple)
+        X, Z = operators if packed else pack_paulis(operators, self.n)
+
+        if len(self.stabilizers) > MAX_ENUMERATED_GENERATORS:
+            # The group is too large to hold as an array: search each coset over GF(2) instead
+            vectors = [pauli_to_vector(operator) for operator in unpack_paulis(X, Z, self.n)]
+            found = min_weight_vectors(self._coset_checks(), vectors)
+            rep_X, rep_Z = pack_paulis([vector_to_pauli(vector, self.n) for vector in found], self.n)
+            weights = row_weights(rep_X, rep_Z)
+            stabilizer_parts = [self._stabilizer_element(f ^ v) for f, v in zip(found, vectors)]
+        else:
+            group_X, group_Z = self.get_stabilizer_group_array()
+            rep_X, rep_Z, weights, indices = min_weight_in_cosets(X, Z, group_X, group_Z, max_elements)
+            stabilizer_parts = None
+        if packed:
+            return (rep_X, rep_Z), weights
+
+        representatives = []
+        for i, (operator, representative) in enumerate(zip(operators, unpack_paulis(rep_X, rep_Z, self.n))):
+            if isinstance(operator, Pauli):
+                # Keep the phase
+                stabilizer = stabilizer_parts[i] if stabilizer_parts else self._generator_product(int(indices[i]))
+                representatives.append(operator * stabilizer)
+            else:
+                representatives.append(representative.to_string())
+        return representatives, weights
+
+    # Analyze all 4^k logical Pauli operators at once: build them as packed arrays and find their
+    # minimum weights up to stabilizers. Returns (labels, representatives, weights, distribution),
+    # where labels such as 'IXY' come in product('IXYZ', repeat=k) order, representatives are
+    # unsigned and distribution maps each minimum weight to the labels that reach it.
+    def logical_weight_table(self, max_elements=1 << 22):
+        import numpy as np
+        from pauli_arrays import num_words, pack_paulis, unpack_paulis
+        indices = sorted(self.logical_x)
+        k = len(indices)
+        LX_X, LX_Z = pack_paulis([self.logical_x[i] for i in indices], self.n)
+        LZ_X, LZ_Z = pack_paulis([self.logical_z[i] for i in indices], self.n)
+
+        # Digit of each logical qubit in base 4, with 0=I, 1=X, 2=Y, 3=Z
+        digits = np.arange(4 ** k)
+        X = np.zeros((4 ** k, num_words(self.n)), dtype=np.uint64)
+        Z = np.zeros_like(X)
+        for position in range(k):
+            digit = (digits >> (2 * (k - 1 - position))) & 3
+            has_x = ((digit == 1) | (digit == 2))[:, np.newaxis]
+            has_z = ((digit == 2) | (digit == 3))[:, np.newaxis]
+            X ^= np.where(has_x, LX_X[position], 0) ^ np.where(has_z, LZ_X[position], 0)
+            Z ^= np.where(has_x, LX_Z[position], 0) ^ np.where(has_z, LZ_Z[position], 0)
+
+        def build():
+            (rep_X, rep_Z), weights = self.min_weight_batch((X, Z), max_elements)
+            return rep_X, rep_Z, weights
+        rep_X, rep_Z, weights = self._persisted('logical_weights', None, build, by_generators=True)
+        representatives = unpack_paulis(rep_X, rep_Z, self.n)
+        if not self._uses_pauli(*self.logical_x.values(), *self.logical_z.values()):
+            representatives = [representative.to_string() for representative in representatives]
+
+        labels = [''.join(symbols) for symbols in product('IXYZ', repeat=k)]
+        distribution = {}
+        for label, weight in zip(labels, weights.tolist()):
+            distribution.setdefault(weight, []).append(label)
+        return labels, representatives, weights, dict(sorted(distribution.items()))
+
+    # Calculate the code distance: the minimum weight of an operator that commutes with every
+    # stabilizer but is not in the stabilizer group (None if the code has no logical operators)
+    def code_distance(self):
+        import numpy as np
+        distance = int(self._persisted('distance', None, lambda: np.array([self._build_code_distance()]))[0])
+        return None if distance < 0 else distance
+
+    def _build_code_distance(self):
+        with instrumentation.span('code_distance'):
+            found = min_weight_logical(self._coset_checks())
+        return found[0] if found else -1
+
+    # Stabilizer and normalizer weight enumerators (A, B) as lists of n + 1 ints: A[w] counts the
+    # elements of weight w of the stabilizer group S and B[w] those of its normalizer N(S), i.e. every
+    # Pauli commuting with S up to phase (classical operators included). Only the smaller of S and
+    # N(S) is enumerated, with vectorized popcounts; the other follows from the quantum MacWilliams
+    # identity. The code distance is the first weight w with B[w] > A[w].
+    def weight_enumerators(self):
+        checks = self._coset_checks()
+        stabilizer_rows = [row for _, row, _ in checks.stabilizer_basis]
+        r = len(stabilizer_rows)
+        if r <= 2 * self.n - r:
+            A = self._enumerated_weights('stabilizer', stabilizer_rows).tolist()
+            B = macwilliams_transform(A, self.n, 1 << r)
+        else:
+            B = self._enumerated_weights('normalizer', stabilizer_rows + checks.logical_rows).tolist()
+            A = macwilliams_transform(B, self.n, 1 << (2 * self.n - r))
+        return A, B
+
+    # Weight distribution of the group spanned by the packed basis vectors rows, persisted as group
+    def _enumerated_weights(self, group, rows):
+        from pauli_arrays import pack_paulis, span_weight_counts
+        def build():
+            with instrumentation.span('weight_enumerators'):
+                X, Z = pack_paulis([vector_to_pauli(row, self.n) for row in rows], self.n)
+                return span_weight_counts(X, Z, self.n)
+        return self._persisted('weight_counts', group, build)
+
+    # Weight distribution of every logical class, as {label: counts} with counts a list of n + 1 ints.
+    # Labels are those of logical_class: '' for the stabilizer group itself, then the classes of
+    # get_labelled_operators(None) in that order. An enumerable group with independent generators is
+    # taken as an array and every coset is counted in one vectorized pass; otherwise each coset is
+    # walked in blocks. The first nonzero count of a class is its minimum weight. The classes add up
+    # to B of weight_enumerators, except in hybrid codes, where the partners of the classical Z
+    # operators are not labelled.
+    def coset_weight_distributions(self, max_elements=1 << 22):
+        def build():
+            import numpy as np
+            from pauli_arrays import coset_weight_counts, pack_paulis, span_weight_counts
+            labelled_operators = [('', Pauli.identity(self.n))] + self.get_labelled_operators()
+            X, Z = pack_paulis([op for _, op in labelled_operators], self.n)
+            rows = [row for _, row, _ in self._coset_checks().stabilizer_basis]
+            with instrumentation.span('coset_weight_distributions'):
+                if len(self.stabilizers) == len(rows) <= MAX_ENUMERATED_GENERATORS:
+                    group_X, group_Z = self.get_stabilizer_group_array()
+                    counts = coset_weight_counts(X, Z, group_X, group_Z, self.n, max_elements)
+                else:
+                    basis_X, basis_Z = pack_paulis([vector_to_pauli(row, self.n) for row in rows], self.n)
+                    counts = np.array([span_weight_counts(basis_X, basis_Z, self.n, (x, z)) for x, z in zip(X, Z)])
+            return {label: row.tolist() for (label, _), row in zip(labelled_operators, counts)}
+        return self._cached('coset_weights', build)
+
     # Get the support of an operator, returns a tuple of qubit indices
     def get_support(self, operator):
+        if isinstance(operator, Pauli):
+            return operator.support()
         support = []
         for i, qubit in enumerate(operator):
             if qubit != 'I':
@@ -63,158 +598,351 @@ class StabilizerCode:
 
     # Get a set of all the supports of a logical operators
     def get_all_supports(self, operator):
-        logical_operators = self.get_logical_operators(operator)
+        support_to_operators = self._cached(('supports', operator), lambda: self._build_all_supports(operator))
+        return {support: list(operators) for support, operators in support_to_operators.items()}
+
+    def _build_all_supports(self, operator):
+        logical_operators = self._cached(('coset', operator), lambda: self._build_logical_operators(operator))
         support_to_operators = {}
-        for logical_operator in logical_operators.keys():
-            support = self.get_support(logical_operator)
-            if support not in support_to_operators:
-                support_to_operators[support] = []
-            support_to_operators[support].append(logical_operator)
+        with instrumentation.span('supports'):
+            for logical_operator in logical_operators.keys():
+                support = self.get_support(logical_operator)
+                if support not in support_to_operators:
+                    support_to_operators[support] = []
+                support_to_operators[support].append(logical_operator)
         return support_to_operators
 
     # Helper function to check if one support is a subset of another
     def is_subset(self, subset, superset):
         return all(x in superset for x in subset)
 
-    # Get a dictionary of all subsets and which logical operators (X,Z,Y) can be implemented on them
-    def get_supported_operators(self, index):
+    # Get the inclusion-minimal supports of the coset of an operator, as qubit bitmasks (qubit q is bit q-1).
+    # Any subset containing one of them can implement the operator.
+    def get_minimal_supports(self, operator):
+        return self._minimal_supports(operator, lambda: self._build_minimal_supports(operator))
+
+    # Memoized minimal supports of the coset of operator, with compute giving them as bitmasks on a miss
+    def _minimal_supports(self, operator, compute):
+        import numpy as np
+        from pauli_arrays import mask_to_words, num_words, words_to_mask
+        words = num_words(self.n)
+        masks = self._persisted('minimal_supports', self._canonical_coset(operator), lambda: np.array(
+            [mask_to_words(mask, words) for mask in compute()], dtype=np.uint64).reshape(-1, words))
+        return [words_to_mask(row) for row in masks]
+
+    def _build_minimal_supports(self, operator):
+        if instrumentation.ENABLED:
+            instrumentation.count('cosets_built')
+        with instrumentation.span('minimal_supports'):
+            return _coset_minimal_supports(self._minimal_supports_task(operator))
+
+    # Packed arguments of _coset_minimal_supports for the coset of operator: the reduced stabilizer
+    # basis (so the walk has no repeats), the operator and n
+    def _minimal_supports_task(self, operator):
+        from pauli_arrays import pack_paulis
+        basis = [vector_to_pauli(row, self.n) for _, row, _ in self._coset_checks().stabilizer_basis]
+        gen_X, gen_Z = pack_paulis(basis, self.n)
+        X, Z = pack_paulis([operator], self.n)
+        return gen_X, gen_Z, (X[0], Z[0]), self.n
+
+    # Compute the minimal supports of several cosets at once on an executor, one coset per task,
+    # and memoize them for get_minimal_supports
+    def _prefetch_minimal_supports(self, operators, executor):
+        missing = [operator for operator in operators
+                   if ('minimal_supports', self._canonical_coset(operator)) not in self._cache]
+        if len(missing) < 2:
+            return
+        tasks = [self._minimal_supports_task(operator) for operator in missing]
+        with instrumentation.span('minimal_supports'):
+            results = list(executor.map(_coset_minimal_supports, tasks))
+        for operator, minimal in zip(missing, results):
+            self._minimal_supports(operator, lambda minimal=minimal: minimal)
+
+    # Get the (label, operator) pairs examined by get_supported_operators. For a logical qubit index
+    # these are its X, Z and Y followed by every product of the classical Z operators (Z2, Z3, Z2Z3,
+    # ...). With index None they are every non-trivial product of the quantum logicals and the
+    # classical operators, labelled like 'X1Y2Z3' (quantum part first, classical indices after).
+    def get_labelled_operators(self, index=None):
+        if index is None:
+            return self._hybrid_labelled_operators()
+
         # Get logical Y by multiplying X and Z
         logical_y = multiply_pauli_list([self.logical_x[index], self.logical_z[index]])
-        
-        # Get all supports for each logical operator
-        x_supports = self.get_all_supports(self.logical_x[index])
-        z_supports = self.get_all_supports(self.logical_z[index])
-        y_supports = self.get_all_supports(logical_y)
-        
+
+        # Logical operator labels and the operators implementing them
+        labelled_operators = [
+            ('X' + str(index), self.logical_x[index]),
+            ('Z' + str(index), self.logical_z[index]),
+            ('Y' + str(index), logical_y),
+        ]
+
+        # Add classical operators if they exist
+        return labelled_operators + [(label, operator) for label, operator in self._classical_products() if label]
+
+    # (label, operator) for every product of the classical Z operators by number of factors and then
+    # by index, starting with the empty product ('', None)
+    def _classical_products(self):
+        indices = sorted(self.classical_z)
+        products = []
+        for size in range(len(indices) + 1):
+            for chosen in combinations(indices, size):
+                label = ''.join('Z' + str(i) for i in chosen)
+                operator = multiply_pauli_list([self.classical_z[i] for i in chosen]) if chosen else None
+                products.append((label, operator))
+        return products
+
+    def _hybrid_labelled_operators(self):
+        indices = sorted(self.logical_x)
+        # Single-qubit logical options per index, as (label, operator or None for identity)
+        options = [[('', None), ('X' + str(i), self.logical_x[i]), ('Z' + str(i), self.logical_z[i]),
+                    ('Y' + str(i), multiply_pauli_list([self.logical_x[i], self.logical_z[i]]))]
+                   for i in indices]
+        classical = self._classical_products()
+
+        labelled_operators = []
+        for choice in product(*options):
+            for classical_label, classical_operator in classical:
+                factors = [operator for _, operator in choice if operator is not None]
+                if classical_operator is not None:
+                    factors.append(classical_operator)
+                if factors:
+                    label = ''.join(label for label, _ in choice) + classical_label
+                    labelled_operators.append((label, multiply_pauli_list(factors)))
+        return labelled_operators
+
+    # Mark, for every subset bitmask, which stabilizer cosets it supports. Operators in the same
+    # coset share one minimal-support computation and one code bit. Returns (codes, coset of each
+    # operator), where bit c of codes[mask] (see support_codes) is set when the subset contains a
+    # minimal support of coset c. With workers and no executor, one process pool serves both the
+    # minimal supports and the lattice closure.
+    def _support_codes(self, labelled_operators, workers=None, executor=None):
+        from concurrent.futures import ProcessPoolExecutor
+        from subset_lattice import support_codes
+        cosets = {}
+        operator_cosets = []
+        representatives = []
+        for _, operator in labelled_operators:
+            canonical = self._canonical_coset(operator)
+            if canonical not in cosets:
+                cosets[canonical] = len(cosets)
+                representatives.append(operator)
+            operator_cosets.append(cosets[canonical])
+
+        def build_with(pool):
+            if pool is not None:
+                self._prefetch_minimal_supports(representatives, pool)
+            minimal_by_coset = [self.get_minimal_supports(operator) for operator in representatives]
+            with instrumentation.span('support_codes'):
+                return support_codes(minimal_by_coset, self.n, workers, pool)
+
+        def build():
+            if executor is not None or workers is None or workers <= 1:
+                return build_with(executor)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return build_with(pool)
+        return self._persisted('support_codes', tuple(cosets), build), operator_cosets
+
+    # Yield (subset, logical operators supported) for all subsets lazily, by size and then
+    # lexicographically; only one code row per subset is held in memory. index selects the
+    # operators as in get_labelled_operators (None: every quantum and classical product).
+    # workers / executor compute the minimal supports of the cosets in parallel (one coset per task)
+    # and shard the subset lattice closure across processes, with the same result as serial. The
+    # subsets are still yielded one by one from this process, so this pays off for several large
+    # cosets on a multi-core machine; on one core or for small codes it only adds process overhead.
+    def iter_supported_operators(self, index=None, workers=None, executor=None):
+        from subset_lattice import iter_subsets
+        labelled_operators = self.get_labelled_operators(index)
+        codes, operator_cosets = self._support_codes(labelled_operators, workers, executor)
+        labels = self._supported_labels(codes, labelled_operators, operator_cosets)
+        for subset, mask in iter_subsets(self.n):
+            yield subset, labels(mask)
+
+    # Lookup from a subset bitmask to the labels of the operators supported on it, given the support
+    # codes of _support_codes. The distinct code rows are found in one vectorized pass and the label
+    # list of each is decoded once, so a lookup is two list indexings.
+    def _supported_labels(self, codes, labelled_operators, operator_cosets):
+        import numpy as np
+        from subset_lattice import code_labels
+        rows = np.ascontiguousarray(codes).view(np.dtype((np.void, codes.dtype.itemsize * codes.shape[1])))
+        _, first, inverse = np.unique(rows.ravel(), return_index=True, return_inverse=True)
+        code_ids = inverse.tolist()
+        labels_by_code = []
+        for index in first.tolist():
+            supported = set(code_labels(codes[index]))
+            labels_by_code.append([label for (label, _), coset in zip(labelled_operators, operator_cosets)
+                                   if coset in supported])
+
+        def labels(mask):
+            if instrumentation.ENABLED:
+                instrumentation.count('subsets_visited')
+            return list(labels_by_code[code_ids[mask]])
+        return labels
+
+    # Generators of the qubit permutations that preserve the stabilizer group and the coset of every
+    # operator in get_labelled_operators(index), so that supported operators are the same on a
+    # subset and on its image. Found by a backtracking search that returns a strong generating set
+    # without listing the group (see find_automorphisms).
+    def automorphisms(self, index=None):
+        def build():
+            operators = [operator for _, operator in self.get_labelled_operators(index)]
+            return find_automorphisms(self, operators)
+        return self._cached(('automorphisms', index), build)
+
+    # Yield (representative subset, orbit size, logical operators supported) for one subset per
+    # orbit of the automorphism group, in the order of iter_supported_operators; each representative
+    # is the smallest bitmask of its orbit and expand_orbit(subset, index) lists the rest (pass the
+    # same automorphisms to both if they are given). automorphisms can be given as a list of
+    # permutation generators (checked with is_automorphism), otherwise they are searched for.
+    def iter_supported_orbits(self, index=None, automorphisms=None, workers=None, executor=None):
+        import numpy as np
+        from automorphisms import subset_orbits
+        from subset_lattice import mask_to_subset
+        labelled_operators = self.get_labelled_operators(index)
+        if automorphisms is None:
+            automorphisms = self.automorphisms(index)
+        else:
+            operators = [operator for _, operator in labelled_operators]
+            for perm in automorphisms:
+                if not is_automorphism(self, perm, operators):
+                    raise ValueError(f"{perm} is not an automorphism fixing the labelled operators")
+        codes, operator_cosets = self._support_codes(labelled_operators, workers, executor)
+        representatives = subset_orbits(self.n, automorphisms)
+        orbit_sizes = np.bincount(representatives, minlength=1 << self.n)
+
+        # Only the representatives are visited, sorted into lattice order
+        masks = np.flatnonzero(representatives == np.arange(1 << self.n)).tolist()
+        subsets = sorted((mask_to_subset(mask) for mask in masks), key=lambda subset: (len(subset), subset))
+        labels = self._supported_labels(codes, labelled_operators, operator_cosets)
+        for subset in subsets:
+            mask = sum(1 << (q - 1) for q in subset)
+            yield subset, int(orbit_sizes[mask]), labels(mask)
+
+    # All subsets (1-based qubit tuples) in the orbit of a subset under the automorphisms, by default
+    # those of iter_supported_orbits with the same index
+    def expand_orbit(self, subset, index=None, automorphisms=None):
+        from subset_lattice import mask_to_subset, subset_to_mask
+        if automorphisms is None:
+            automorphisms = self.automorphisms(index)
+        return [mask_to_subset(mask) for mask in orbit(subset_to_mask(subset), automorphisms)]
+
+    # Get a dictionary of all subsets and which logical operators (X,Z,Y, classical products) can
+    # be implemented on them
+    def get_supported_operators(self, index=None, workers=None, executor=None):
         # Dictionary of subset:logical operators supported
-        result = {}
-        
-        # Generate and process all subsets
-        for size in range(0, self.n + 1):
-            for subset in combinations(range(1, self.n + 1), size):
-                operators = []
-                
-                # Check quantum operators
-                if any(self.is_subset(x_support, subset) for x_support in x_supports):
-                    operators.append('X' + str(index))
-                if any(self.is_subset(z_support, subset) for z_support in z_supports):
-                    operators.append('Z' + str(index))
-                if any(self.is_subset(y_support, subset) for y_support in y_supports):
-                    operators.append('Y' + str(index))
-                
-                # Check classical operators if they exist
-                if self.classical_z:
-                    z2_supports = self.get_all_supports(self.classical_z[2])
-                    z3_supports = self.get_all_supports(self.classical_z[3])
-                    z2z3_supports = self.get_all_supports(pauli_multiply(self.classical_z[2], self.classical_z[3]))
-                    
-                    if any(self.is_subset(support, subset) for support in z2_supports):
-                        operators.append('Z2')
-                    if any(self.is_subset(support, subset) for support in z3_supports):
-                        operators.append('Z3')
-                    if any(self.is_subset(support, subset) for support in z2z3_supports):
-                        operators.append('Z2Z3')
-                
-                result[subset] = operators
-        
-        return result
-
-
-
-# Define the [[4,1,2]] stabilizer code
-four_one_two = StabilizerCode(
-    n=4,
-    k=1,
-    d=2,
-    stabilizers=["XXXX", "IIZZ", "ZZII"],
-    logical_x={1: "XXII"},
-    logical_z={1: "ZIZI"},
-    k_c=1
-)
-
-# Define the [[8,1,3]] stabilizer code
-eight_one_three = StabilizerCode(
-    n=8,
-    k=1,
-    d=3,
-    stabilizers=[
-        "XXXXXXXX",  # S1 = X1X2X3X4X5X6X7X8
-        "ZZZZZZZZ",  # S2 = Z1Z2Z3Z4Z5Z6Z7Z8
-        "IXIXYZYZ",  # 
-        "IXZYIXZY",  # 
-        "IYXZXZIY",  # 
-        "IIZZIIZZ",  # 
-        "IIIIZZZZ"   # 
-    ],
-    logical_x={1: "XXIIIZIZ"},  # X4X5X7X8
-    logical_z={1: "IZIZIZIZ"}   # Z2X3Z5X8
-)
-
-# Define the [[8,1:2,3]] hybrid stabilizer code
-eight_one_two_three = StabilizerCode(
-    n=8,
-    k=1,
-    d=3,
-    stabilizers=[
-        "XXXXXXXX",  # S1 = X1X2X3X4X5X6X7X8
-        "ZZZZZZZZ",  # S2 = Z1Z2Z3Z4Z5Z6Z7Z8
-        "IXIXYZYZ",  # 
-        "IXZYIXZY",  # 
-        "IYXZXZIY",  # 
-    ],
-    logical_x={1: "XXIIIZIZ"},  # X4X5X7X8
-    logical_z={1: "IZIZIZIZ"},   # Z2X3Z5X8
-    classical_z={
-        2: "IIZZIIZZ",
-        3: "IIIIZZZZ" 
-    },
-    k_c=2
-)
-
-# Define the [[8,3,3]] stabilizer code
-eight_three_three = StabilizerCode(
-    n=8,
-    k=3,
-    d=3,
-    stabilizers=[
-        "XXXXXXXX",  # S1 = X1X2X3X4X5X6X7X8
-        "ZZZZZZZZ",  # S2 = Z1Z2Z3Z4Z5Z6Z7Z8
-        "IXIXYZYZ",  # 
-        "IXZYIXZY",  # 
-        "IYXZXZIY",  # 
-    ],
-    logical_x={1: "XXIIIZIZ", 2: "XIXZIIZI", 3: "XIIZXZII"},  # X4X5X7X8
-    logical_z={1: "IZIZIZIZ", 2: "IIZZIIZZ", 3: "IIIIZZZZ"},   # Z2X3Z5X8
-)
-
-# define the [[7,1,3]] stabilizer code
-seven_one_three = StabilizerCode(
-    n=7,
-    k=1,
-    d=3,
-    stabilizers=[
-        "IIIXXXX",  # S1 =
-        "IXXIIXX",  # S2 = 
-        "XIXIXIX",  # 
-        "IIIZZZZ",  # 
-        "IZZIIZZ",  # 
-        "ZIZIZIZ"
-    ],
-    logical_x={1: "XXXXXXX"},  # X4X5X7X8
-    logical_z={1: "ZZZZZZZ"},   # Z2X3Z5X8
-)
-
-# define the [[5,1,3]] stabilizer code
-five_one_three = StabilizerCode(
-    n=5,
-    k=1,
-    d=3,
-    stabilizers=[
-        "XZZXI",  # S1 =
-        "IXZZX",  # S2 = 
-        "XIXZZ",  # 
-        "ZXIXZ"
-    ],
-    logical_x={1: "XXXXX"},  # X4X5X7X8
-    logical_z={1: "ZZZZZ"},   # Z2X3Z5X8
-)
\ No newline at end of file
+        return dict(self.iter_supported_operators(index, workers, executor))
+
+
+# Built-in example codes as StabilizerCode arguments. get_code(name) builds each one on first use,
+# and they stay importable by name (from stabilizer_code import five_one_three) through __getattr__.
+BUILTIN_CODES = {
+    # Define the [[4,1,2]] stabilizer code
+    'four_one_two': dict(
+        n=4,
+        k=1,
+        d=2,
+        stabilizers=["XXXX", "IIZZ", "ZZII"],
+        logical_x={1: "XXII"},
+        logical_z={1: "ZIZI"},
+        k_c=1
+    ),
+    # Define the [[8,1,3]] stabilizer code
+    'eight_one_three': dict(
+        n=8,
+        k=1,
+        d=3,
+        stabilizers=[
+            "XXXXXXXX",  # S1 = X1X2X3X4X5X6X7X8
+            "ZZZZZZZZ",  # S2 = Z1Z2Z3Z4Z5Z6Z7Z8
+            "IXIXYZYZ",  # 
+            "IXZYIXZY",  # 
+            "IYXZXZIY",  # 
+            "IIZZIIZZ",  # 
+            "IIIIZZZZ"   # 
+        ],
+        logical_x={1: "XXIIIZIZ"},  # X4X5X7X8
+        logical_z={1: "IZIZIZIZ"}   # Z2X3Z5X8
+    ),
+    # Define the [[8,1:2,3]] hybrid stabilizer code
+    'eight_one_two_three': dict(
+        n=8,
+        k=1,
+        d=3,
+        stabilizers=[
+            "XXXXXXXX",  # S1 = X1X2X3X4X5X6X7X8
+            "ZZZZZZZZ",  # S2 = Z1Z2Z3Z4Z5Z6Z7Z8
+            "IXIXYZYZ",  # 
+            "IXZYIXZY",  # 
+            "IYXZXZIY",  # 
+        ],
+        logical_x={1: "XXIIIZIZ"},  # X4X5X7X8
+        logical_z={1: "IZIZIZIZ"},   # Z2X3Z5X8
+        classical_z={
+            2: "IIZZIIZZ",
+            3: "IIIIZZZZ" 
+        },
+        k_c=2
+    ),
+    # Define the [[8,3,3]] stabilizer code
+    'eight_three_three': dict(
+        n=8,
+        k=3,
+        d=3,
+        stabilizers=[
+            "XXXXXXXX",  # S1 = X1X2X3X4X5X6X7X8
+            "ZZZZZZZZ",  # S2 = Z1Z2Z3Z4Z5Z6Z7Z8
+            "IXIXYZYZ",  # 
+            "IXZYIXZY",  # 
+            "IYXZXZIY",  # 
+        ],
+        logical_x={1: "XXIIIZIZ", 2: "XIXZIIZI", 3: "XIIZXZII"},  # X4X5X7X8
+        logical_z={1: "IZIZIZIZ", 2: "IIZZIIZZ", 3: "IIIIZZZZ"},   # Z2X3Z5X8
+    ),
+    # define the [[7,1,3]] stabilizer code
+    'seven_one_three': dict(
+        n=7,
+        k=1,
+        d=3,
+        stabilizers=[
+            "IIIXXXX",  # S1 =
+            "IXXIIXX",  # S2 = 
+            "XIXIXIX",  # 
+            "IIIZZZZ",  # 
+            "IZZIIZZ",  # 
+            "ZIZIZIZ"
+        ],
+        logical_x={1: "XXXXXXX"},  # X4X5X7X8
+        logical_z={1: "ZZZZZZZ"},   # Z2X3Z5X8
+    ),
+    # define the [[5,1,3]] stabilizer code
+    'five_one_three': dict(
+        n=5,
+        k=1,
+        d=3,
+        stabilizers=[
+            "XZZXI",  # S1 =
+            "IXZZX",  # S2 = 
+            "XIXZZ",  # 
+            "ZXIXZ"
+        ],
+        logical_x={1: "XXXXX"},  # X4X5X7X8
+        logical_z={1: "ZZZZZ"},   # Z2X3Z5X8
+    ),
+}
+
+# Codes built so far, by name
+_registry = {}
+
+
+# Get a built-in example code by name, building it on first use
+def get_code(name):
+    if name not in _registry:
+        if name not in BUILTIN_CODES:
+            raise KeyError(f"Unknown code: {name!r}")
+        _registry[name] = StabilizerCode(**BUILTIN_CODES[name])
+    return _registry[name]
+
+
+def __getattr__(name):
+    if name in BUILTIN_CODES:
+        return get_code(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,190 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from multiprocessing.shared_memory import SharedMemory
+import instrumentation
+
+
+# Convert a subset of 1-based qubit indices (e.g. (1, 3, 4)) to a bitmask (qubit q is bit q-1)
+def subset_to_mask(subset):
+    mask = 0
+    for q in subset:
+        mask |= 1 << (q - 1)
+    return mask
+
+
+# Convert a bitmask back to a sorted tuple of 1-based qubit indices
+def mask_to_subset(mask):
+    subset = []
+    q = 1
+    while mask:
+        if mask & 1:
+            subset.append(q)
+        mask >>= 1
+        q += 1
+    return tuple(subset)
+
+
+# Yield (subset, mask) for every subset of n qubits, by size and then lexicographically
+def iter_subsets(n):
+    bits = [1 << i for i in range(n)]
+    for size in range(0, n + 1):
+        for subset, mask_bits in zip(combinations(range(1, n + 1), size), combinations(bits, size)):
+            yield subset, sum(mask_bits)
+
+
+# Size of every subset bitmask of n qubits, as an array indexed by mask
+def popcounts(n):
+    sizes = np.zeros(1 << n, dtype=np.int64)
+    for i in range(n):
+        sizes.reshape(-1, 2, 1 << i)[:, 1, :] += 1
+    return sizes
+
+
+# Reduce a collection of support bitmasks to its inclusion-minimal antichain, sorted by (size, mask)
+def minimal_antichain(masks):
+    minimal = []
+    for mask in sorted(set(masks), key=lambda m: (m.bit_count(), m)):
+        if not any(kept & mask == kept for kept in minimal):
+            minimal.append(mask)
+    return minimal
+
+
+# Return a boolean array over all 2^n subsets that is True exactly on supersets of some mask.
+# This is the monotone up-set generated by masks, computed by a superset-closure (zeta transform)
+# pass over one qubit at a time instead of testing each subset against each mask.
+def upset(masks, n):
+    flags = np.zeros(1 << n, dtype=bool)
+    masks = list(masks)
+    if masks:
+        flags[masks] = True
+    for i in range(n):
+        view = flags.reshape(-1, 2, 1 << i)
+        view[:, 1, :] |= view[:, 0, :]
+    return flags
+
+
+# Inclusion-minimal antichain of an array of support bitmasks of n qubits, sorted by (size, mask)
+# like minimal_antichain. A mask is minimal unless one of its subsets one qubit smaller lies in
+# the up-set of the masks, which two whole-array passes over the 2^n subsets decide.
+def minimal_masks(masks, n):
+    masks = np.asarray(masks, dtype=np.int64)
+    above = upset(masks, n)
+    # strict[m]: some mask is a proper subset of m
+    strict = np.zeros(1 << n, dtype=bool)
+    for i in range(n):
+        strict.reshape(-1, 2, 1 << i)[:, 1, :] |= above.reshape(-1, 2, 1 << i)[:, 0, :]
+    minimal = np.unique(masks[~strict[masks]]).tolist()
+    return sorted(minimal, key=lambda m: (m.bit_count(), m))
+
+
+# Decode one row of support_codes into the sorted list of label positions whose bits are set
+def code_labels(row):
+    code = int.from_bytes(row.astype('<u8').tobytes(), 'little')
+    labels = []
+    j = 0
+    while code:
+        if code & 1:
+            labels.append(j)
+        code >>= 1
+        j += 1
+    return labels
+
+
+# Run each phase's shards over a shared array: phases is a list of (fn, [args, ...]) and every shard
+# calls fn(array, *args) on a disjoint part of it. Phases run in order and shards within a phase may
+# run in parallel. Without workers or an executor everything runs in-process on array itself;
+# otherwise the array is placed in shared memory so workers write their parts in place.
+def run_shards(array, phases, workers=None, executor=None):
+    if executor is None and (workers is None or workers <= 1):
+        for fn, shard_args in phases:
+            for args in shard_args:
+                fn(array, *args)
+        return array
+
+    shm = SharedMemory(create=True, size=max(1, array.nbytes))
+    try:
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        shared[...] = array
+        pool = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+        try:
+            for fn, shard_args in phases:
+                tasks = [(shm.name, array.shape, array.dtype.str, fn, args) for args in shard_args]
+                list(pool.map(_run_shared_shard, tasks))
+        finally:
+            if executor is None:
+                pool.shutdown()
+        result = shared.copy()
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
+
+
+# Worker side of run_shards: attach to the shared array and run one shard
+def _run_shared_shard(task):
+    name, shape, dtype, fn, args = task
+    # Pool workers share the parent's resource tracker, so attaching needs no unregister: the
+    # parent's unlink drops the one registration
+    shm = SharedMemory(name=name)
+    try:
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        fn(array, *args)
+        del array
+    finally:
+        shm.close()
+
+
+# Split range(total) into at most shards contiguous (start, stop) ranges
+def shard_ranges(total, shards):
+    shards = max(1, min(shards, total))
+    bounds = [total * i // shards for i in range(shards + 1)]
+    return [(bounds[i], bounds[i + 1]) for i in range(shards)]
+
+
+# OR-closure over the low qubits inside rows [start, stop) of the (blocks, 2^low_bits) view.
+# Any trailing axes of codes (code words) are carried along.
+def _close_low_bits(codes, low_bits, start, stop):
+    words = codes.shape[1:]
+    rows = codes.reshape(-1, 1 << low_bits, *words)[start:stop]
+    for i in range(low_bits):
+        view = rows.reshape(stop - start, -1, 2, 1 << i, *words)
+        view[:, :, 1, :] |= view[:, :, 0, :]
+
+
+# OR-closure over the high qubits inside columns [start, stop) of the (blocks, 2^low_bits) view
+def _close_high_bits(codes, low_bits, start, stop):
+    columns = codes.reshape(-1, 1 << low_bits, *codes.shape[1:])[:, start:stop]
+    blocks = columns.shape[0]
+    for i in range((blocks - 1).bit_length()):
+        step = 1 << i
+        for block in range(blocks):
+            if block & step:
+                columns[block] |= columns[block ^ step]
+
+
+# Compute, for every subset bitmask of n qubits, a bitset of the labels it supports as a
+# (2^n, words) uint64 array: bit j of a row (word j // 64, bit j % 64) is set when the subset
+# contains one of minimal_by_label[j]. The superset closure runs first over the low qubits inside
+# blocks of fixed high qubits, then over the high qubits inside column ranges, so with workers (or
+# an executor) both passes shard across processes and give the serial result.
+# workers also sets the number of shards when an executor is passed (default: the CPU count).
+def support_codes(minimal_by_label, n, workers=None, executor=None):
+    if instrumentation.ENABLED:
+        instrumentation.count('lattice_subsets', 1 << n)
+    words = max(1, (len(minimal_by_label) + 63) // 64)
+    codes = np.zeros((1 << n, words), dtype=np.uint64)
+    for j, minimal in enumerate(minimal_by_label):
+        for mask in minimal:
+            codes[mask, j // 64] |= np.uint64(1 << (j % 64))
+
+    shards = workers or (os.cpu_count() if executor is not None else 1) or 1
+    high_bits = min(n, max(0, (shards - 1).bit_length() + 2))
+    low_bits = n - high_bits
+    phases = [
+        (_close_low_bits, [(low_bits, start, stop) for start, stop in shard_ranges(1 << high_bits, shards)]),
+        (_close_high_bits, [(low_bits, start, stop) for start, stop in shard_ranges(1 << low_bits, shards)]),
+    ]
+    return run_shards(codes, phases, workers, executor)
@@ -0,0 +1,333 @@
+from itertools import combinations, product
+from pauli_methods import Pauli
+
+
+# Pack a Pauli into a single GF(2) row vector x | z << n
+def pauli_to_vector(pauli):
+    return pauli.x | (pauli.z << pauli.n)
+
+
+# Unpack a GF(2) row vector x | z << n into an unsigned Pauli
+def vector_to_pauli(vector, n):
+    return Pauli(n, vector & ((1 << n) - 1), vector >> n)
+
+
+# Number of qubits a packed vector acts on
+def vector_weight(vector, n):
+    return ((vector | (vector >> n)) & ((1 << n) - 1)).bit_count()
+
+
+# Symplectic inner product of two packed vectors (0 if the Paulis commute, 1 if they anticommute)
+def symplectic_product(a, b, n):
+    full = (1 << n) - 1
+    return (((a & full) & (b >> n)) ^ ((a >> n) & (b & full))).bit_count() & 1
+
+
+# Swap the X and Z halves, so that symplectic products become ordinary dot products
+def symplectic_swap(vector, n):
+    return (vector >> n) | ((vector & ((1 << n) - 1)) << n)
+
+
+# Reduce a list of GF(2) row vectors to reduced row-echelon form.
+# Returns (pivot, row, combination) triples with the highest pivot first, where combination is a
+# bitmask of the input rows that XOR to row. Every pivot bit is cleared in all other rows.
+def row_reduce(rows):
+    reduced = []
+    for i, row in enumerate(rows):
+        combination = 1 << i
+        for pivot, prow, pcombination in reduced:
+            if (row >> pivot) & 1:
+                row ^= prow
+                combination ^= pcombination
+        if not row:
+            continue
+        pivot = row.bit_length() - 1
+        for j, (p, prow, pcombination) in enumerate(reduced):
+            if (prow >> pivot) & 1:
+                reduced[j] = (p, prow ^ row, pcombination ^ combination)
+        reduced.append((pivot, row, combination))
+    reduced.sort(reverse=True)
+    return reduced
+
+
+# Rank of a list of GF(2) row vectors
+def gf2_rank(rows):
+    return len(row_reduce(rows))
+
+
+# Reduce a vector against a row-reduced basis; returns (remainder, combination).
+# The remainder is zero exactly when the vector lies in the span of the basis.
+def reduce_vector(vector, reduced):
+    combination = 0
+    for pivot, row, row_combination in reduced:
+        if (vector >> pivot) & 1:
+            vector ^= row
+            combination ^= row_combination
+    return vector, combination
+
+
+# Basis of the null space {v : v . row = 0 for every row} of vectors with num_bits bits
+def null_space(rows, num_bits):
+    reduced = row_reduce(rows)
+    pivots = {pivot for pivot, _, _ in reduced}
+    basis = []
+    for free in range(num_bits):
+        if free in pivots:
+            continue
+        vector = 1 << free
+        for pivot, row, _ in reduced:
+            if (row >> free) & 1:
+                vector |= 1 << pivot
+        basis.append(vector)
+    return basis
+
+
+# Basis of the symplectic complement of the span of rows (all Paulis commuting with every row)
+def symplectic_complement(rows, n):
+    return null_space([symplectic_swap(row, n) for row in rows], 2 * n)
+
+
+# Quantum MacWilliams transform: given the weight distribution counts[0..n] of a group of size
+# Paulis on n qubits, return the weight distribution of its symplectic complement, from
+# B(x, y) = A(x + 3y, x - y) / size with A(x, y) = sum_w counts[w] x^(n-w) y^w. The transform is
+# its own inverse up to the size, so it maps S to N(S) and N(S) back to S.
+def macwilliams_transform(counts, n, size):
+    dual = [0] * (n + 1)
+    for j, count in enumerate(counts):
+        if not count:
+            continue
+        # Coefficients of (x + 3y)^(n-j) (x - y)^j by power of y
+        coefficients = [1]
+        for factor in [3] * (n - j) + [-1] * j:
+            coefficients = [a + factor * b for a, b in zip(coefficients + [0], [0] + coefficients)]
+        for w, coefficient in enumerate(coefficients):
+            dual[w] += int(count) * coefficient
+    return [value // size for value in dual]
+
+
+# Precomputed data for weight searches in the stabilizer group S generated by stabilizer_rows:
+# a check basis made of S itself followed by logical vectors completing S to its normalizer N(S).
+# The syndrome of E against the checks (S part in the low bits) identifies E's coset of S.
+class CosetChecks:
+
+    def __init__(self, stabilizer_rows, n):
+        self.n = n
+        self.stabilizer_basis = row_reduce(stabilizer_rows)
+        self.num_stabilizers = len(self.stabilizer_basis)
+
+        # Extend a basis of S to one of N(S) with logical vectors
+        logical_rows = []
+        extended = list(self.stabilizer_basis)
+        for vector in symplectic_complement(stabilizer_rows, n):
+            if reduce_vector(vector, extended)[0]:
+                logical_rows.append(vector)
+                extended = row_reduce([row for _, row, _ in extended] + [vector])
+        self.logical_rows = logical_rows
+
+        # E is in a given coset of S exactly when it has that coset's syndrome against the
+        # symplectic complement of N(S), i.e. against N(S) itself
+        self.checks = [row for _, row, _ in self.stabilizer_basis] + logical_rows
+        self.qubit_options = []
+        for q in range(n):
+            options = []
+            for x, z in ((1, 0), (1, 1), (0, 1)):
+                vector = (x << q) | (z << (q + n))
+                options.append((self.syndrome(vector), x << q, z << q))
+            self.qubit_options.append(options)
+
+    # Syndrome of a packed vector against the checks; bit j is the product with check j
+    def syndrome(self, vector):
+        result = 0
+        for j, check in enumerate(self.checks):
+            result |= symplectic_product(vector, check, self.n) << j
+        return result
+
+
+# Yield (syndrome, x, z) for every Pauli of exactly the given weight supported on qubits
+def iter_weight_paulis(qubits, weight, qubit_options):
+    for support in combinations(qubits, weight):
+        for choice in product(*(qubit_options[q] for q in support)):
+            syndrome = x = z = 0
+            for option_syndrome, option_x, option_z in choice:
+                syndrome ^= option_syndrome
+                x |= option_x
+                z |= option_z
+            yield syndrome, x, z
+
+
+# Yield the (left, right) qubit splits used by the meet-in-the-middle searches. Every weight-w
+# Pauli has exactly w // 2 of its support in the left half of at least one cyclic window.
+def _windows(n):
+    half = n // 2
+    for shift in range(n):
+        left = [(shift + i) % n for i in range(half)]
+        left_set = set(left)
+        yield left, [q for q in range(n) if q not in left_set]
+
+
+# Find a weight-w Pauli with the given syndrome, meeting in the middle over cyclic qubit windows.
+# Returns the packed vector or None.
+def _find_with_syndrome(checks, target, weight):
+    n = checks.n
+    left_weight = weight // 2
+    right_weight = weight - left_weight
+    for left, right in _windows(n):
+        if left_weight > len(left) or right_weight > len(right):
+            continue
+        table = {}
+        for syndrome, x, z in iter_weight_paulis(left, left_weight, checks.qubit_options):
+            table.setdefault(syndrome, (x, z))
+        for syndrome, x, z in iter_weight_paulis(right, right_weight, checks.qubit_options):
+            match = table.get(target ^ syndrome)
+            if match is not None:
+                return (x | match[0]) | ((z | match[1]) << n)
+    return None
+
+
+# Minimum weight element of the coset vector + S, searching weights below the vector's own weight
+def min_weight_in_coset(checks, vector):
+    n = checks.n
+    target = checks.syndrome(vector)
+    for weight in range(vector_weight(vector, n)):
+        found = _find_with_syndrome(checks, target, weight)
+        if found is not None:
+            return found
+    return vector
+
+
+# Minimum weight elements of the cosets vector + S for many vectors. Vectors in N(S) share a single
+# search over the logical classes; the others are searched one coset at a time.
+def min_weight_vectors(checks, vectors):
+    shift = checks.num_stabilizers
+    syndromes = [checks.syndrome(vector) for vector in vectors]
+    logical_classes = {syndrome >> shift for syndrome in syndromes if not syndrome & ((1 << shift) - 1)}
+    by_class = min_weight_by_class(checks, wanted=logical_classes)
+    results = []
+    for vector, syndrome in zip(vectors, syndromes):
+        if syndrome == 0:
+            results.append(0)
+        elif not syndrome & ((1 << shift) - 1) and syndrome >> shift in by_class:
+            weight, found = by_class[syndrome >> shift]
+            results.append(found if weight < vector_weight(vector, checks.n) else vector)
+        else:
+            results.append(min_weight_in_coset(checks, vector))
+    return results
+
+
+# Find minimum-weight members of the nontrivial logical classes N(S)/S in one search. Classes are
+# named by their logical syndrome (syndrome >> num_stabilizers). Returns {class: (weight, vector)}
+# for the classes in wanted (default: all), stopping once they are all found or past max_weight
+# (default n). One enumeration per window serves every class still missing.
+def min_weight_by_class(checks, wanted=None, max_weight=None):
+    n = checks.n
+    shift = checks.num_stabilizers
+    if wanted is None:
+        wanted = range(1, 1 << len(checks.logical_rows))
+    missing = {logical_class for logical_class in wanted if logical_class}
+    found = {}
+    for weight in range(1, (max_weight or n) + 1):
+        if not missing:
+            break
+        left_weight = weight // 2
+        right_weight = weight - left_weight
+        for left, right in _windows(n):
+            if not missing:
+                break
+            if left_weight > len(left) or right_weight > len(right):
+                continue
+            table = {}
+            for syndrome, x, z in iter_weight_paulis(left, left_weight, checks.qubit_options):
+                table.setdefault(syndrome, (x, z))
+            targets = {logical_class << shift: logical_class for logical_class in missing}
+            for syndrome, x, z in iter_weight_paulis(right, right_weight, checks.qubit_options):
+                for target, logical_class in list(targets.items()):
+                    match = table.get(target ^ syndrome)
+                    if match is not None:
+                        found[logical_class] = (weight, (x | match[0]) | ((z | match[1]) << n))
+                        missing.discard(logical_class)
+                        del targets[target]
+                if not targets:
+                    break
+    return found
+
+
+# Minimum weight of a Pauli in N(S) but not in S (the code distance) as (weight, vector), or None
+# if N(S) = S. Searches weights up to max_weight (default n).
+def min_weight_logical(checks, max_weight=None):
+    n = checks.n
+    if not checks.logical_rows:
+        return None
+    stabilizer_mask = (1 << checks.num_stabilizers) - 1
+    shift = checks.num_stabilizers
+    for weight in range(1, (max_weight or n) + 1):
+        left_weight = weight // 2
+        right_weight = weight - left_weight
+        for left, right in _windows(n):
+            if left_weight > len(left) or right_weight > len(right):
+                continue
+            # Stabilizer syndrome -> {logical syndrome: Pauli}
+            table = {}
+            for syndrome, x, z in iter_weight_paulis(left, left_weight, checks.qubit_options):
+                table.setdefault(syndrome & stabilizer_mask, {}).setdefault(syndrome >> shift, (x, z))
+            for syndrome, x, z in iter_weight_paulis(right, right_weight, checks.qubit_options):
+                for logical, match in table.get(syndrome & stabilizer_mask, {}).items():
+                    if logical != syndrome >> shift:
+                        return weight, (x | match[0]) | ((z | match[1]) << n)
+    return None
+
+
+# Reduced row-echelon tableau of a code: the stabilizer generators plus its logical X/Z pairs and
+# classical Z operators (dicts of index -> packed vector). Membership, syndromes and logical classes
+# are read off by elimination against it, in O(n r) word operations instead of a 2^r enumeration.
+class SymplecticTableau:
+
+    def __init__(self, stabilizer_rows, logical_x_rows, logical_z_rows, classical_rows, n):
+        self.n = n
+        self.generators = list(stabilizer_rows)
+        self.stabilizer_basis = row_reduce(self.generators)
+        self.logical_x = dict(logical_x_rows)
+        self.logical_z = dict(logical_z_rows)
+        # Classical operators reduced modulo S, so a combination of them is read off the remainder
+        self.classical_indices = sorted(classical_rows)
+        self.classical_basis = row_reduce([reduce_vector(classical_rows[i], self.stabilizer_basis)[0]
+                                           for i in self.classical_indices])
+        # (syndrome, x, z) of X, Y and Z on each qubit, for iter_weight_paulis
+        self.qubit_options = [[(self.syndrome((x << q) | (z << (q + n))), x << q, z << q)
+                               for x, z in ((1, 0), (1, 1), (0, 1))] for q in range(n)]
+
+    # Syndrome of a packed vector: bit i is set when it anticommutes with generator i
+    def syndrome(self, vector):
+        result = 0
+        for i, generator in enumerate(self.generators):
+            result |= symplectic_product(vector, generator, self.n) << i
+        return result
+
+    # Generator-index bitmask whose product equals the vector up to phase, or None if not in S
+    def stabilizer_combination(self, vector):
+        remainder, combination = reduce_vector(vector, self.stabilizer_basis)
+        return None if remainder else combination
+
+    # Logical class of a packed vector in the normalizer, as ({index: 'X'/'Y'/'Z'}, [classical
+    # indices]) with trivial parts left out. Raises ValueError if the vector has a nonzero syndrome
+    # or is not a product of the stabilizers, logicals and classical operators.
+    def logical_class(self, vector):
+        if self.syndrome(vector):
+            raise ValueError("Operator does not commute with the stabilizers")
+        quantum = {}
+        residual = vector
+        for index in sorted(self.logical_x):
+            # X_i anticommutes only with Z_i among the logicals, and Z_i only with X_i
+            has_x = symplectic_product(vector, self.logical_z[index], self.n)
+            has_z = symplectic_product(vector, self.logical_x[index], self.n)
+            if has_x:
+                residual ^= self.logical_x[index]
+            if has_z:
+                residual ^= self.logical_z[index]
+            if has_x or has_z:
+                quantum[index] = 'IXZY'[has_x + 2 * has_z]
+        remainder, combination = reduce_vector(reduce_vector(residual, self.stabilizer_basis)[0],
+                                               self.classical_basis)
+        if remainder:
+            raise ValueError("Operator is not in the span of the stabilizers, logicals and classical operators")
+        classical = [index for j, index in enumerate(self.classical_indices) if (combination >> j) & 1]
+        return quantum, classical
@@ -0,0 +1,126 @@
+import os
+import numpy as np
+import pytest
+import analysis_cache
+from analysis_cache import AnalysisCache, code_fingerprint
+from pauli_methods import as_pauli
+from stabilizer_code import BUILTIN_CODES, StabilizerCode, get_code
+
+FINGERPRINT = 'f' * 32
+
+
+# Copy of a built-in code with other stabilizer generators
+def with_generators(name, stabilizers):
+    code = get_code(name)
+    return StabilizerCode(code.n, code.k, code.d, stabilizers, dict(code.logical_x), dict(code.logical_z),
+                          dict(code.classical_z), code.k_c)
+
+
+# Set the mtime of an entry's files, i.e. its last use
+def set_last_used(cache, kind, when):
+    for path in cache._index['entries'][f"{FINGERPRINT}/{kind}"]['files']:
+        os.utime(os.path.join(cache.directory, path), (when, when))
+
+
+@pytest.mark.parametrize('name', list(BUILTIN_CODES))
+def test_fingerprint_ignores_the_generating_set(name):
+    code = get_code(name)
+    generators = list(code.stabilizers)
+    product = (as_pauli(generators[0]) * as_pauli(generators[-1])).to_string()
+    permuted = with_generators(name, generators[::-1])
+    redundant = with_generators(name, generators[1:] + [product, generators[0]])
+    assert code_fingerprint(permuted) == code_fingerprint(redundant) == code_fingerprint(code)
+    # The logical operators are part of the fingerprint
+    other = with_generators(name, generators)
+    other.logical_x = {**other.logical_x, min(other.logical_x): other.logical_z[min(other.logical_z)]}
+    assert code_fingerprint(other) != code_fingerprint(code)
+
+
+def test_round_trip_and_tuples(tmp_path):
+    cache = AnalysisCache(str(tmp_path))
+    cache.put(FINGERPRINT, 'single', np.arange(5))
+    cache.put(FINGERPRINT, 'pair', (np.arange(3), np.ones((2, 2))), key=7)
+    assert cache.get(FINGERPRINT, 'single').tolist() == list(range(5))
+    first, second = cache.get(FINGERPRINT, 'pair', 7)
+    assert first.tolist() == [0, 1, 2] and second.tolist() == [[1, 1], [1, 1]]
+    assert cache.get(FINGERPRINT, 'pair', 8) is None
+    assert cache.stats == {'hits': 2, 'misses': 1, 'evictions': 0}
+
+
+def test_other_cache_version_is_rejected(tmp_path, monkeypatch):
+    AnalysisCache(str(tmp_path)).put(FINGERPRINT, 'single', np.arange(5))
+    monkeypatch.setattr(analysis_cache, 'CACHE_VERSION', analysis_cache.CACHE_VERSION + 1)
+    cache = AnalysisCache(str(tmp_path))
+    assert cache.get(FINGERPRINT, 'single') is None
+    assert cache.size() == 0
+    assert not os.listdir(tmp_path / FINGERPRINT)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    array = np.zeros(1000, dtype=np.uint8)
+    cache = AnalysisCache(str(tmp_path), max_bytes=3500)
+    for when, kind in enumerate(['a', 'b', 'c']):
+        cache.put(FINGERPRINT, kind, array)
+        set_last_used(cache, kind, 1000 + when)
+    # A hit makes 'a' the most recently used, so 'b' and then 'c' go first
+    assert cache.get(FINGERPRINT, 'a') is not None
+    cache.put(FINGERPRINT, 'd', array)
+    assert cache.stats['evictions'] == 1
+    assert [cache.get(FINGERPRINT, kind) is not None for kind in 'abcd'] == [True, False, True, True]
+    cache.put(FINGERPRINT, 'e', np.zeros(2000, dtype=np.uint8))
+    assert [cache.get(FINGERPRINT, kind) is not None for kind in 'acde'] == [False, False, True, True]
+    assert cache.size() <= 3500
+    assert sorted(os.listdir(tmp_path / FINGERPRINT)) == ['d.0.npy', 'e.0.npy']
+
+
+def test_eviction_leaves_other_files_alone(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'precious.npy').write_bytes(b'keep')
+    (tmp_path / 'notes.tmp').write_bytes(b'keep')
+    (tmp_path / FINGERPRINT).mkdir()
+    (tmp_path / FINGERPRINT / 'mine.npy').write_bytes(b'keep')
+    # Leftovers of a crashed writer are named like the cache's own files
+    (tmp_path / FINGERPRINT / 'orphan.0.npy').write_bytes(b'stale')
+    (tmp_path / FINGERPRINT / 'orphan.0.npy.123.tmp').write_bytes(b'stale')
+    (tmp_path / f"index.json.123.{'0' * 32}.tmp").write_bytes(b'stale')
+    AnalysisCache(str(tmp_path)).put(FINGERPRINT, 'single', np.arange(5))
+    assert (tmp_path / 'sub' / 'precious.npy').exists()
+    assert (tmp_path / 'notes.tmp').exists()
+    assert sorted(os.listdir(tmp_path / FINGERPRINT)) == ['mine.npy', 'single.0.npy']
+    assert sorted(os.listdir(tmp_path)) == [FINGERPRINT, 'index.json', 'index.lock', 'notes.tmp', 'sub']
+
+
+def test_instances_sharing_a_directory_keep_each_others_entries(tmp_path):
+    first, second = AnalysisCache(str(tmp_path)), AnalysisCache(str(tmp_path))
+    first.put(FINGERPRINT, 'a', np.arange(3))
+    second.put(FINGERPRINT, 'b', np.arange(4))
+    first.put(FINGERPRINT, 'c', np.arange(5))
+    for cache in (first, second, AnalysisCache(str(tmp_path))):
+        assert [cache.get(FINGERPRINT, kind).tolist() for kind in 'abc'] == [[0, 1, 2], [0, 1, 2, 3],
+                                                                              [0, 1, 2, 3, 4]]
+    # The copy stored first is kept
+    second.put(FINGERPRINT, 'a', np.arange(9))
+    assert first.get(FINGERPRINT, 'a').tolist() == [0, 1, 2]
+
+
+def test_stabilizer_code_round_trip(tmp_path):
+    code = get_code('eight_three_three')
+    expected = code.logical_weight_table()
+    operator = code.logical_x[1]
+    expected_supports = code.get_minimal_supports(operator)
+
+    cache = AnalysisCache(str(tmp_path))
+    first = with_generators('eight_three_three', list(code.stabilizers))
+    first.use_cache(cache)
+    first.logical_weight_table()
+    first.get_minimal_supports(operator)
+    assert cache.stats['hits'] == 0 and cache.size() > 0
+
+    second = with_generators('eight_three_three', list(code.stabilizers))
+    second.use_cache(AnalysisCache(str(tmp_path)))
+    labels, representatives, weights, _ = second.logical_weight_table()
+    assert labels == expected[0]
+    assert representatives == expected[1] and np.array_equal(weights, expected[2])
+    assert second.get_minimal_supports(operator) == expected_supports
+    assert second.persistent_cache.stats['hits'] >= 2
+    assert second.persistent_cache.stats['misses'] == 0
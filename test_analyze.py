@@ -0,0 +1,20 @@
+from analyze import iter_results
+from stabilizer_code import get_code
+
+
+# A serial run with a cache must not attach the cache to (or clear) the shared get_code instance
+def test_builtin_jobs_leave_the_registry_code_alone(tmp_path):
+    shared = get_code('five_one_three')
+    shared.get_stabilizer_group()
+    memo = dict(shared._cache)
+    records = list(iter_results([{'builtin': 'five_one_three'}], ['distance', 'group'], cache_dir=str(tmp_path)))
+    assert [record['analysis'] for record in records] == ['distance', 'group']
+    assert records[0]['result'] == 3 and 'error' not in records[1]
+    assert shared.persistent_cache is None
+    assert shared._cache == memo
+
+
+def test_unknown_builtin_gives_an_error_record():
+    records = list(iter_results([{'builtin': 'no_such_code'}, {'builtin': 'five_one_three'}], ['distance']))
+    assert records[0]['code'] == 'no_such_code' and 'no_such_code' in records[0]['error']
+    assert records[1] == {**records[1], 'code': 'five_one_three', 'analysis': 'distance', 'result': 3}
@@ -0,0 +1,55 @@
+from itertools import permutations
+import pytest
+from automorphisms import compose, find_automorphisms, is_automorphism
+from stabilizer_code import BUILTIN_CODES, get_code
+
+
+# All elements of the group generated by the given permutations of n qubits
+def group_closure(generators, n):
+    identity = tuple(range(n))
+    group = {identity}
+    frontier = [identity]
+    while frontier:
+        next_frontier = []
+        for element in frontier:
+            for generator in generators:
+                product = compose(element, generator)
+                if product not in group:
+                    group.add(product)
+                    next_frontier.append(product)
+        frontier = next_frontier
+    return group
+
+
+# The index values of iter_supported_orbits: None and every logical qubit
+def indices(code):
+    return [None] + sorted(code.logical_x)
+
+
+# Every built-in code has n <= 8, so all n! permutations can be checked
+@pytest.mark.parametrize('name', list(BUILTIN_CODES))
+def test_find_automorphisms_matches_brute_force(name):
+    code = get_code(name)
+    stabilizer_automorphisms = [perm for perm in permutations(range(code.n)) if is_automorphism(code, perm)]
+    assert group_closure(find_automorphisms(code), code.n) == set(stabilizer_automorphisms)
+    for index in indices(code):
+        operators = [operator for _, operator in code.get_labelled_operators(index)]
+        expected = {perm for perm in stabilizer_automorphisms if is_automorphism(code, perm, operators)}
+        assert group_closure(code.automorphisms(index), code.n) == expected
+
+
+@pytest.mark.parametrize('name', list(BUILTIN_CODES))
+def test_orbits_cover_the_supported_operators(name):
+    code = get_code(name)
+    for index in indices(code):
+        supported = code.get_supported_operators(index)
+        seen = set()
+        total = 0
+        for subset, size, labels in code.iter_supported_orbits(index):
+            members = code.expand_orbit(subset, index)
+            assert len(members) == size and members[0] == subset
+            for member in members:
+                assert supported[member] == labels
+            seen.update(members)
+            total += size
+        assert total == len(seen) == 1 << code.n
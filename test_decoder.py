@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from brute_force import PauliSpace
+from decoder import LookupDecoder
+from pauli_arrays import pack_paulis, row_weights, unpack_paulis
+from stabilizer_code import BUILTIN_CODES, StabilizerCode, get_code
+
+
+# Every single-qubit X, Y and Z error on n qubits as Pauli strings
+def weight_one_errors(n):
+    return ['I' * q + kind + 'I' * (n - q - 1) for q in range(n) for kind in 'XYZ']
+
+
+@pytest.mark.parametrize('name', ['five_one_three', 'seven_one_three', 'eight_three_three'])
+def test_weight_one_errors_are_corrected(name):
+    code = get_code(name)
+    decoder = LookupDecoder(code)
+    X, Z = pack_paulis(weight_one_errors(code.n), code.n)
+    residual_X, residual_Z = decoder.correct(X, Z)
+    for residual in unpack_paulis(residual_X, residual_Z, code.n):
+        assert code.is_stabilizer(residual.to_string())
+
+
+@pytest.mark.parametrize('name', list(BUILTIN_CODES))
+def test_table_weights_are_minimal(name):
+    code = get_code(name)
+    decoder = LookupDecoder(code)
+    space = PauliSpace(code)
+    expected = np.full(1 << len(code.stabilizers), -1, dtype=np.int64)
+    for syndrome in np.unique(space.syndromes):
+        expected[syndrome] = space.weights[space.syndromes == syndrome].min()
+    assert decoder.weights.tolist() == expected.tolist()
+    # Each correction has its syndrome and its stated weight
+    covered = np.flatnonzero(decoder.weights >= 0)
+    assert decoder.syndromes(decoder.table_X[covered], decoder.table_Z[covered]).tolist() == covered.tolist()
+    assert row_weights(decoder.table_X[covered], decoder.table_Z[covered]).tolist() \
+        == decoder.weights[covered].tolist()
+
+
+def test_max_weight_limits_coverage():
+    code = get_code('eight_three_three')
+    decoder = LookupDecoder(code, max_weight=1)
+    assert decoder.coverage() == 1 + 3 * code.n
+    assert decoder.weights.max() == 1
+    assert decoder.correction(0) == 'I' * code.n
+
+
+def test_save_and_load(tmp_path):
+    code = get_code('seven_one_three')
+    decoder = LookupDecoder(code)
+    path = tmp_path / 'table.npz'
+    decoder.save(path)
+    loaded = LookupDecoder.load(code, path)
+    for name in ('table_X', 'table_Z', 'weights'):
+        assert np.array_equal(getattr(loaded, name), getattr(decoder, name))
+    bits = [[(syndrome >> i) & 1 for i in range(len(code.stabilizers))] for syndrome in range(8)]
+    assert [loaded.correction(syndrome) for syndrome in range(8)] \
+        == [decoder.correction(syndrome) for syndrome in range(8)]
+    assert np.array_equal(loaded.decode(bits)[0], decoder.decode(list(range(8)))[0])
+
+
+def test_load_rejects_other_generators(tmp_path):
+    code = get_code('eight_three_three')
+    path = tmp_path / 'table.npz'
+    LookupDecoder(code).save(path)
+    with pytest.raises(ValueError):
+        LookupDecoder.load(get_code('eight_one_three'), path)
+    # The same group with the generators in another order has other syndrome integers
+    reordered = StabilizerCode(**{**BUILTIN_CODES['eight_three_three'],
+                                  'stabilizers': BUILTIN_CODES['eight_three_three']['stabilizers'][::-1]})
+    with pytest.raises(ValueError):
+        LookupDecoder.load(reordered, path)
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+# Import time budget in seconds for the light modules, measured in a fresh interpreter
+IMPORT_BUDGET = 0.15
+
+# Modules that must only be loaded on the code paths that need them
+HEAVY_MODULES = ('numpy', 'sympy', 'matplotlib', 'networkx')
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+# Import module in a fresh interpreter; returns (best import seconds, heavy modules left loaded)
+def measure_import(module, runs=3):
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(elapsed, *[name for name in {HEAVY_MODULES!r} if name in sys.modules])\n"
+    )
+    best, heavy = float('inf'), []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', script], cwd=HERE, check=True,
+                                capture_output=True, text=True).stdout.split()
+        best = min(best, float(output[0]))
+        heavy = output[1:]
+    return best, heavy
+
+
+def test_pauli_methods_import_is_light():
+    seconds, heavy = measure_import('pauli_methods')
+    assert not heavy, f"pauli_methods imports {heavy}"
+    assert seconds < IMPORT_BUDGET, f"pauli_methods took {seconds:.3f}s to import"
+
+
+def test_stabilizer_code_import_is_light():
+    seconds, heavy = measure_import('stabilizer_code')
+    assert not heavy, f"stabilizer_code imports {heavy}"
+    assert seconds < IMPORT_BUDGET, f"stabilizer_code took {seconds:.3f}s to import"
+
+
+def test_builtin_codes_are_lazy():
+    import stabilizer_code
+    assert 'five_one_three' not in stabilizer_code.__dict__
+    assert stabilizer_code.five_one_three is stabilizer_code.get_code('five_one_three')
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+from pauli_methods import as_pauli, multiply_pauli_list
+from stabilizer_code import StabilizerCode, get_code
+
+
+# Copy of a built-in code with its operators as strings or as Paulis, and the generators replaced
+def make_code(name, use_pauli, stabilizers=None):
+    code = get_code(name)
+    convert = as_pauli if use_pauli else str
+    return StabilizerCode(
+        n=code.n, k=code.k, d=code.d,
+        stabilizers=[convert(gen) for gen in (code.stabilizers if stabilizers is None else stabilizers)],
+        logical_x={i: convert(op) for i, op in code.logical_x.items()},
+        logical_z={i: convert(op) for i, op in code.logical_z.items()},
+        classical_z={i: convert(op) for i, op in code.classical_z.items()},
+        k_c=code.k_c,
+    )
+
+
+# Logical X, Z and Y of every logical qubit, in the same form as the code's operators
+def probe_operators(code):
+    operators = []
+    for i in sorted(code.logical_x):
+        operators += [code.logical_x[i], code.logical_z[i],
+                      multiply_pauli_list([code.logical_x[i], code.logical_z[i]])]
+    return operators
+
+
+# Every memoized result the incremental updates keep, computed for the probe operators. Dicts are
+# listed as items, so their order has to match too.
+def snapshot(code):
+    operators = probe_operators(code)
+    return {
+        'group': list(code.get_stabilizer_group().items()),
+        'cosets': [list(code.get_logical_operators(op).items()) for op in operators],
+        'supports': [list(code.get_all_supports(op).items()) for op in operators],
+        'minimal_supports': [code.get_minimal_supports(op) for op in operators],
+        'group_array': code.get_stabilizer_group_array(),
+        'coset_arrays': [code.get_logical_operators_array(op) for op in operators],
+    }
+
+
+def assert_same(updated, fresh):
+    left, right = snapshot(updated), snapshot(fresh)
+    for key in ('group', 'cosets', 'supports', 'minimal_supports'):
+        assert left[key] == right[key], key
+    for left_arrays, right_arrays in zip([left['group_array']] + left['coset_arrays'],
+                                         [right['group_array']] + right['coset_arrays']):
+        for a, b in zip(left_arrays, right_arrays):
+            assert np.array_equal(a, b)
+
+
+@pytest.mark.parametrize('use_pauli', [False, True])
+@pytest.mark.parametrize('name', ['five_one_three', 'eight_three_three'])
+def test_add_stabilizer_matches_rebuild(name, use_pauli):
+    generators = get_code(name).stabilizers
+    code = make_code(name, use_pauli, generators[:-1])
+    snapshot(code)
+    code.add_stabilizer(as_pauli(generators[-1]) if use_pauli else generators[-1])
+    assert_same(code, make_code(name, use_pauli))
+
+
+@pytest.mark.parametrize('use_pauli', [False, True])
+@pytest.mark.parametrize('index', [1, 2, 4])
+def test_remove_stabilizer_matches_rebuild(index, use_pauli):
+    generators = get_code('five_one_three').stabilizers
+    code = make_code('five_one_three', use_pauli)
+    snapshot(code)
+    code.remove_stabilizer(index)
+    assert_same(code, make_code('five_one_three', use_pauli, generators[:index - 1] + generators[index:]))
+
+
+@pytest.mark.parametrize('use_pauli', [False, True])
+def test_replace_logical_matches_rebuild(use_pauli):
+    code = make_code('seven_one_three', use_pauli)
+    snapshot(code)
+    # Equivalent logical X and Z: each times a stabilizer
+    new_x = multiply_pauli_list([code.logical_x[1], code.stabilizers[0]])
+    new_z = multiply_pauli_list([code.logical_z[1], code.stabilizers[3]])
+    code.replace_logical(1, logical_x=new_x, logical_z=new_z)
+
+    fresh = make_code('seven_one_three', use_pauli)
+    fresh.logical_x = {1: new_x}
+    fresh.logical_z = {1: new_z}
+    assert_same(code, fresh)
+    assert code.logical_weight_table()[2].tolist() == fresh.logical_weight_table()[2].tolist()
+
+
+@pytest.mark.parametrize('use_pauli', [False, True])
+def test_dependent_generators_fall_back_to_rebuild(use_pauli):
+    generators = get_code('five_one_three').stabilizers
+    product = multiply_pauli_list([as_pauli(generators[0]), as_pauli(generators[1])])
+    dependent = product if use_pauli else product.to_string()
+
+    # Adding an element of the group
+    code = make_code('five_one_three', use_pauli)
+    snapshot(code)
+    code.add_stabilizer(dependent)
+    assert_same(code, make_code('five_one_three', use_pauli, generators + [dependent]))
+
+    # Removing from a dependent generating set
+    code.remove_stabilizer(1)
+    assert_same(code, make_code('five_one_three', use_pauli, generators[1:] + [dependent]))
+
+
+@pytest.mark.parametrize('index', [0, -1, 5])
+def test_remove_stabilizer_rejects_bad_index(index):
+    code = make_code('five_one_three', False)
+    before = list(code.stabilizers)
+    with pytest.raises(IndexError):
+        code.remove_stabilizer(index)
+    assert code.stabilizers == before
+    assert_same(code, make_code('five_one_three', False))
@@ -0,0 +1,105 @@
+import random
+import pytest
+from brute_force import PauliSpace
+from code_families import random_stabilizer_code, rotated_surface_code
+from pauli_methods import Pauli, as_pauli
+from stabilizer_code import BUILTIN_CODES, get_code
+from symplectic import pauli_to_vector
+
+
+# The built-in codes (n = 4, 5, 7 and 8) and random codes with odd n, where the cyclic half-windows
+# of the meet-in-the-middle search are uneven
+CODES = list(BUILTIN_CODES) + ['random_9_1', 'random_11_3']
+
+
+def load_code(name):
+    if name.startswith('random_'):
+        n, k = map(int, name.split('_')[1:])
+        return random_stabilizer_code(n, k, seed=n, compute_distance=False)
+    return get_code(name)
+
+
+# Unsigned (x, z) masks of every element of the stabilizer group
+def group_masks(code):
+    return {(element.x, element.z) for element, _ in code.iter_stabilizer_group()}
+
+
+# Labelled logical and classical operators plus random Paulis (most not in the normalizer)
+def probe_operators(code):
+    rng = random.Random(code.n)
+    operators = [operator for _, operator in code.get_labelled_operators()]
+    for _ in range(20):
+        operators.append(Pauli(code.n, rng.getrandbits(code.n), rng.getrandbits(code.n)))
+    return operators
+
+
+def brute_min_weight(operator, masks):
+    operator = as_pauli(operator)
+    return min(((operator.x ^ x) | (operator.z ^ z)).bit_count() for x, z in masks)
+
+
+# Minimum weight over all 4^n Paulis that commute with every generator but are not stabilizers
+def brute_distance(code):
+    space = PauliSpace(code)
+    logical = space.commutes & ~space.stabilizer
+    return int(space.weights[logical].min()) if logical.any() else None
+
+
+def assert_in_coset(representative, operator, masks):
+    difference = pauli_to_vector(as_pauli(representative)) ^ pauli_to_vector(as_pauli(operator))
+    n = as_pauli(operator).n
+    assert (difference & ((1 << n) - 1), difference >> n) in masks
+
+
+@pytest.mark.parametrize('name', CODES)
+@pytest.mark.parametrize('method', ['enumerate', 'search'])
+def test_min_weight_representative_matches_brute_force(name, method):
+    code = load_code(name)
+    masks = group_masks(code)
+    for operator in probe_operators(code):
+        representative = code.min_weight_representative(operator, method)
+        assert as_pauli(representative).weight == brute_min_weight(operator, masks)
+        assert_in_coset(representative, operator, masks)
+
+
+@pytest.mark.parametrize('name', CODES)
+def test_min_weight_batch_matches_brute_force(name):
+    code = load_code(name)
+    masks = group_masks(code)
+    operators = probe_operators(code)
+    representatives, weights = code.min_weight_batch(operators)
+    assert weights.tolist() == [brute_min_weight(operator, masks) for operator in operators]
+    for representative, operator in zip(representatives, operators):
+        assert_in_coset(representative, operator, masks)
+
+
+@pytest.mark.parametrize('name', CODES)
+def test_code_distance_matches_brute_force(name):
+    code = load_code(name)
+    assert code.code_distance() == brute_distance(code)
+
+
+# Rotated surface codes small enough to enumerate by default (d = 4 has 15 generators), so lowering
+# MAX_ENUMERATED_GENERATORS switches the same code to the meet-in-the-middle search
+@pytest.mark.parametrize('d', [3, 4])
+def test_search_path_matches_enumeration(d, monkeypatch):
+    enumerated = rotated_surface_code(d)
+    operators = probe_operators(enumerated)
+    labels, _, table_weights, _ = enumerated.logical_weight_table()
+    _, weights = enumerated.min_weight_batch(operators)
+
+    monkeypatch.setattr('stabilizer_code.MAX_ENUMERATED_GENERATORS', 0)
+    searched = rotated_surface_code(d)
+    search_labels, _, search_table_weights, _ = searched.logical_weight_table()
+    search_representatives, search_weights = searched.min_weight_batch(operators)
+
+    assert search_labels == labels
+    assert search_table_weights.tolist() == table_weights.tolist()
+    assert search_weights.tolist() == weights.tolist()
+    for operator, representative in zip(operators, search_representatives):
+        # Signed Paulis must keep the phase: operator * representative is a signed stabilizer
+        if isinstance(operator, Pauli):
+            assert searched.is_stabilizer(as_pauli(operator) * representative)
+        else:
+            assert_in_coset(representative, operator, group_masks(searched))
+    assert searched.code_distance() == enumerated.code_distance() == d
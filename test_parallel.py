@@ -0,0 +1,59 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pytest
+import subset_lattice
+from access_structure import get_hasse_edges
+from code_families import random_stabilizer_code
+from stabilizer_code import BUILTIN_CODES, StabilizerCode
+
+# Built-in codes (n = 4 to 8) and a random [[10,2]] code with larger cosets
+CODES = ['four_one_two', 'seven_one_three', 'eight_one_two_three', 'eight_three_three', 'random_10_2']
+
+
+# A fresh instance, so nothing is memoized from another run
+def fresh_code(name):
+    if name.startswith('random_'):
+        n, k = map(int, name.split('_')[1:])
+        return random_stabilizer_code(n, k, seed=n, compute_distance=False)
+    return StabilizerCode(**BUILTIN_CODES[name])
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ProcessPoolExecutor(2) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize('name', CODES)
+def test_supported_operators_match_serial(name, executor):
+    serial = fresh_code(name).get_supported_operators(None)
+    assert fresh_code(name).get_supported_operators(None, workers=2) == serial
+    assert fresh_code(name).get_supported_operators(None, executor=executor) == serial
+    assert list(fresh_code(name).iter_supported_operators(None, workers=2)) == list(serial.items())
+
+
+@pytest.mark.parametrize('n', [0, 1, 2, 5, 9])
+def test_hasse_edges_match_serial(n, executor):
+    serial = get_hasse_edges(n)
+    assert serial.shape == (n << (n - 1) if n else 0, 2)
+    assert np.array_equal(get_hasse_edges(n, workers=2), serial)
+    # Twice on the same workers, so shared blocks from the first run are not reused
+    for _ in range(2):
+        assert np.array_equal(get_hasse_edges(n, executor=executor), serial)
+
+
+# One get_supported_operators call with workers starts a single pool for the minimal supports and
+# the lattice closure
+def test_workers_start_one_pool(monkeypatch):
+    started = []
+
+    class CountingPool(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            started.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr('concurrent.futures.ProcessPoolExecutor', CountingPool)
+    monkeypatch.setattr(subset_lattice, 'ProcessPoolExecutor', CountingPool)
+    assert fresh_code('eight_three_three').get_supported_operators(None, workers=2) \
+        == fresh_code('eight_three_three').get_supported_operators(None)
+    assert len(started) == 1
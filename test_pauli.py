@@ -0,0 +1,57 @@
+import random
+import numpy as np
+import pytest
+from pauli_methods import Pauli, multiply_pauli_list, pauli_multiply
+
+SINGLE_QUBIT = {
+    'I': np.eye(2, dtype=complex),
+    'X': np.array([[0, 1], [1, 0]], dtype=complex),
+    'Y': np.array([[0, -1j], [1j, 0]]),
+    'Z': np.array([[1, 0], [0, -1]], dtype=complex),
+}
+
+
+# Explicit 2^n x 2^n matrix of a Pauli, qubit 1 being the leftmost tensor factor
+def matrix(pauli):
+    result = np.array([[1j ** pauli.phase]])
+    for label in pauli.to_string():
+        result = np.kron(result, SINGLE_QUBIT[label])
+    return result
+
+
+def random_pauli(rng, n):
+    return Pauli(n, rng.getrandbits(n), rng.getrandbits(n), rng.randrange(4))
+
+
+@pytest.mark.parametrize('n', [1, 2, 3])
+def test_products_match_matrices(n):
+    rng = random.Random(n)
+    for _ in range(2000 // n):
+        a, b = random_pauli(rng, n), random_pauli(rng, n)
+        product = a * b
+        assert np.allclose(matrix(product), matrix(a) @ matrix(b))
+        assert product.commutes(b) == np.allclose(matrix(a) @ matrix(b), matrix(b) @ matrix(a))
+
+
+def test_every_single_qubit_product():
+    for a in 'IXYZ':
+        for b in 'IXYZ':
+            product = Pauli.from_string(a) * Pauli.from_string(b)
+            assert np.allclose(matrix(product), SINGLE_QUBIT[a] @ SINGLE_QUBIT[b])
+            assert product.to_string() == pauli_multiply(a, b)
+
+
+@pytest.mark.parametrize('label', ['XYZ', '+XYZ', 'iXYZ', '+iXYZ', '-XYZ', '-iXYZ'])
+def test_phase_prefixes(label):
+    pauli = Pauli.from_string(label)
+    assert Pauli.from_string(str(pauli)) == pauli
+    assert str(pauli).lstrip('-i') == 'XYZ'
+
+
+def test_strings_multiply_without_phase():
+    rng = random.Random(0)
+    for _ in range(200):
+        paulis = [random_pauli(rng, 4) for _ in range(3)]
+        signed = multiply_pauli_list(paulis)
+        assert multiply_pauli_list([pauli.to_string() for pauli in paulis]) == signed.to_string()
+        assert np.allclose(matrix(signed), matrix(paulis[0]) @ matrix(paulis[1]) @ matrix(paulis[2]))
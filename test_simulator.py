@@ -0,0 +1,77 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import pytest
+import simulator
+from simulator import iter_error_counts, logical_error_rates
+from stabilizer_code import get_code
+
+# 20 batches, more than the tasks in flight with two workers
+SHOTS, BATCH_SIZE = 20 << 10, 1 << 10
+
+
+# Names of the shared blocks iter_error_counts creates
+@pytest.fixture
+def shared_names(monkeypatch):
+    names = []
+    share_arrays = simulator._share_arrays
+
+    def recording(arrays):
+        blocks, descriptors = share_arrays(arrays)
+        names.extend(block.name for block in blocks)
+        return blocks, descriptors
+    monkeypatch.setattr(simulator, '_share_arrays', recording)
+    return names
+
+
+def assert_unlinked(names):
+    assert names
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+
+
+@pytest.mark.parametrize('name', ['five_one_three', 'eight_one_two_three'])
+def test_parallel_counts_match_serial(name, shared_names):
+    code = get_code(name)
+    serial = logical_error_rates(code, 0.05, SHOTS, BATCH_SIZE, seed=3)
+    assert serial['failure']['shots'] == SHOTS and serial['failure']['failures'] > 0
+    assert logical_error_rates(code, 0.05, SHOTS, BATCH_SIZE, seed=3, workers=2) == serial
+    with ProcessPoolExecutor(2) as executor:
+        # Twice on the same workers, which attach to the second run's table
+        for _ in range(2):
+            assert logical_error_rates(code, 0.05, SHOTS, BATCH_SIZE, seed=3, executor=executor) == serial
+    with ThreadPoolExecutor(2) as executor:
+        assert logical_error_rates(code, 0.05, SHOTS, BATCH_SIZE, seed=3, executor=executor) == serial
+    assert logical_error_rates(code, 0.05, SHOTS, BATCH_SIZE, seed=5) != serial
+    assert_unlinked(shared_names)
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_early_stop_unlinks_shared_blocks(workers, shared_names):
+    code = get_code('seven_one_three')
+    with ProcessPoolExecutor(2) as executor:
+        for done, counts in iter_error_counts(code, 0.05, SHOTS, BATCH_SIZE, seed=1, workers=workers,
+                                              executor=executor if workers is None else None):
+            break
+    assert done == BATCH_SIZE
+    assert_unlinked(shared_names)
+
+
+# Batches are scheduled as results are consumed: a run far too long to plan up front starts at once,
+# with at most two batches per worker submitted
+def test_batches_are_scheduled_lazily():
+    code = get_code('five_one_three')
+    submitted = []
+
+    class RecordingPool(ThreadPoolExecutor):
+        def submit(self, fn, *args):
+            submitted.append(args)
+            return super().submit(fn, *args)
+
+    with RecordingPool(2) as executor:
+        counts = iter_error_counts(code, 0.05, 1 << 60, 16, seed=1, workers=2, executor=executor)
+        assert next(counts)[0] == 16
+        assert len(submitted) == 4
+        counts.close()
+    serial = iter_error_counts(code, 0.05, 1 << 60, 16, seed=1)
+    assert next(serial)[0] == 16
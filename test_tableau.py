@@ -0,0 +1,48 @@
+import random
+import pytest
+from brute_force import PauliSpace
+from pauli_methods import Pauli, as_pauli
+from stabilizer_code import BUILTIN_CODES, get_code
+
+
+@pytest.mark.parametrize('name', list(BUILTIN_CODES))
+def test_logical_class_of_operators_times_stabilizers(name):
+    code = get_code(name)
+    rng = random.Random(code.n)
+    elements = [element for element, _ in code.iter_stabilizer_group()]
+    for label, operator in code.get_labelled_operators(None):
+        for _ in range(10):
+            dressed = as_pauli(operator) * rng.choice(elements)
+            assert code.syndrome(dressed) == 0
+            assert code.logical_class(dressed) == label
+            assert code.logical_class(dressed.to_string()) == label
+            assert not code.is_stabilizer(dressed)
+
+
+@pytest.mark.parametrize('name', list(BUILTIN_CODES))
+def test_is_stabilizer_keeps_the_sign(name):
+    code = get_code(name)
+    for element, _ in code.iter_stabilizer_group():
+        assert code.is_stabilizer(element)
+        assert code.is_stabilizer(element.to_string())
+        assert code.logical_class(element) == ''
+        # -S is not in the group (it would contain -I); as a string the sign is not compared
+        negated = Pauli(code.n, element.x, element.z, element.phase + 2)
+        assert not code.is_stabilizer(negated)
+        assert code.is_stabilizer(negated.to_string())
+
+
+@pytest.mark.parametrize('name', list(BUILTIN_CODES))
+def test_syndromes_match_brute_force(name):
+    code = get_code(name)
+    space = PauliSpace(code)
+    rng = random.Random(code.n)
+    for vector in rng.sample(range(len(space.x)), 200):
+        pauli = Pauli(code.n, int(space.x[vector]), int(space.z[vector]))
+        assert code.syndrome(pauli) == space.syndromes[vector]
+        if space.syndromes[vector]:
+            assert not code.is_stabilizer(pauli)
+            with pytest.raises(ValueError):
+                code.logical_class(pauli)
+        else:
+            assert code.is_stabilizer(pauli.to_string()) == space.stabilizer[vector]
@@ -0,0 +1,78 @@
+import pytest
+from brute_force import PauliSpace
+from code_families import rotated_surface_code
+from pauli_arrays import pack_paulis, span_weight_counts
+from pauli_methods import as_pauli
+from stabilizer_code import BUILTIN_CODES, StabilizerCode, get_code
+from symplectic import macwilliams_transform
+
+
+# Weight distributions (A, B) of S and N(S) by brute force over all 4^n Paulis
+def brute_enumerators(code):
+    space = PauliSpace(code)
+    return space.weight_counts(space.stabilizer), space.weight_counts(space.commutes)
+
+
+# Copy of a built-in code with the product of its first two generators appended
+def with_dependent_generator(code):
+    product = as_pauli(code.stabilizers[0]) * as_pauli(code.stabilizers[1])
+    return StabilizerCode(code.n, code.k, code.d, list(code.stabilizers) + [product.to_string()],
+                          dict(code.logical_x), dict(code.logical_z), dict(code.classical_z), code.k_c)
+
+
+@pytest.mark.parametrize('name', list(BUILTIN_CODES))
+def test_weight_enumerators_match_brute_force(name):
+    code = get_code(name)
+    A, B = code.weight_enumerators()
+    assert (A, B) == brute_enumerators(code)
+    # The transform is its own inverse up to the group sizes
+    assert macwilliams_transform(B, code.n, sum(B)) == A
+    assert code.code_distance() == next(w for w, (a, b) in enumerate(zip(A, B)) if b > a)
+
+
+@pytest.mark.parametrize('name', list(BUILTIN_CODES))
+def test_coset_weight_distributions(name):
+    code = get_code(name)
+    A, B = code.weight_enumerators()
+    distributions = code.coset_weight_distributions()
+    assert distributions[''] == A
+    labelled_operators = code.get_labelled_operators()
+    assert list(distributions) == [''] + [label for label, _ in labelled_operators]
+    # The first nonzero count of each class is its minimum weight
+    _, weights = code.min_weight_batch([operator for _, operator in labelled_operators])
+    assert [next(w for w, count in enumerate(counts) if count) for counts in list(distributions.values())[1:]] \
+        == weights.tolist()
+    if not code.classical_z:
+        assert [sum(column) for column in zip(*distributions.values())] == B
+
+
+@pytest.mark.parametrize('name', list(BUILTIN_CODES))
+def test_dependent_generators_take_the_block_walk(name):
+    code = get_code(name)
+    dependent = with_dependent_generator(code)
+    assert dependent.weight_enumerators() == code.weight_enumerators()
+    assert dependent.coset_weight_distributions() == code.coset_weight_distributions()
+
+
+# Small blocks make span_weight_counts walk most generators in Gray-code order, with and without
+# a coset offset
+@pytest.mark.parametrize('block_bits', [0, 1, 3])
+@pytest.mark.parametrize('name', ['eight_three_three', 'eight_one_two_three'])
+def test_span_weight_counts_blocks(name, block_bits):
+    code = get_code(name)
+    X, Z = pack_paulis(code.stabilizers, code.n)
+    offset_X, offset_Z = pack_paulis([code.logical_x[min(code.logical_x)]], code.n)
+    for offset in (None, (offset_X[0], offset_Z[0])):
+        assert (span_weight_counts(X, Z, code.n, offset, block_bits).tolist()
+                == span_weight_counts(X, Z, code.n, offset).tolist())
+    assert span_weight_counts(X, Z, code.n, None, block_bits).tolist() == code.weight_enumerators()[0]
+
+
+# 24 generators: the group is walked in 2^16-element blocks with 2^8 Gray-code steps
+def test_weight_enumerators_past_one_block():
+    code = rotated_surface_code(5)
+    A, B = code.weight_enumerators()
+    assert sum(A) == 1 << 24 and sum(B) == 1 << 26
+    assert macwilliams_transform(B, code.n, sum(B)) == A
+    assert next(w for w, (a, b) in enumerate(zip(A, B)) if b > a) == 5
+    assert [sum(column) for column in zip(*code.coset_weight_distributions().values())] == B